@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite backend with ``on_commit()`` hooks, which Django 1.6 lacks, and
+connections tuned for several writers.
+
+Every new connection runs DEFAULT_PRAGMAS, updated with the PRAGMAS
+dict of its DATABASES entry (None leaves a pragma out). Transactions
+of atomic blocks start as ``BEGIN <TRANSACTION_MODE>``, IMMEDIATE by
+default: a transaction that reads first and writes later then waits
+for other writers up front, instead of failing with "database is
+locked" when it tries to write.
+
+Hooks registered inside an atomic block run once the outermost block
+commits and autocommit is back on; they are dropped if the block, or
+the savepoint they were registered in, is rolled back. Outside atomic
+blocks they run at once.
+"""
+from __future__ import unicode_literals
+from django.db.backends.sqlite3.base import *  # noqa
+from django.db.backends.sqlite3.base import \
+    DatabaseWrapper as SQLiteDatabaseWrapper
+from django.core.exceptions import ImproperlyConfigured
+from django.db.transaction import TransactionManagementError
+
+import re
+
+
+DEFAULT_PRAGMAS = (
+    # readers don't block the writer and the other way round
+    ('journal_mode', 'WAL'),
+    # with WAL, fsync at checkpoints only; a crash can't corrupt the db
+    ('synchronous', 'NORMAL'),
+    # ms to wait for a lock held by another connection
+    ('busy_timeout', 5000),
+    ('mmap_size', 64 * 1024 * 1024),
+    # negative: in KB
+    ('cache_size', -16000),
+)
+
+PRAGMA_VALUE = re.compile(r'^-?\w+$')
+
+
+class DatabaseWrapper(SQLiteDatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        # (savepoint ids, function) pairs
+        self.run_on_commit = []
+        self.run_commit_hooks_on_autocommit = False
+        super(DatabaseWrapper, self).__init__(*args, **kwargs)
+
+    # atomic() turns sqlite autocommit back on by setting this attribute
+    @property
+    def autocommit(self):
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, autocommit):
+        self._autocommit = autocommit
+        if autocommit and self.run_commit_hooks_on_autocommit:
+            self.run_and_clear_commit_hooks()
+
+    def pragmas(self):
+        pragmas = dict(DEFAULT_PRAGMAS)
+        pragmas.update(self.settings_dict.get('PRAGMAS', {}))
+        names = [name for name, value in DEFAULT_PRAGMAS] + \
+            sorted(set(pragmas) - set(dict(DEFAULT_PRAGMAS)))
+        return [(name, pragmas[name]) for name in names
+                if pragmas[name] is not None]
+
+    def init_connection_state(self):
+        super(DatabaseWrapper, self).init_connection_state()
+        cursor = self.connection.cursor()
+        try:
+            for name, value in self.pragmas():
+                if not PRAGMA_VALUE.match('%s' % name) or \
+                        not PRAGMA_VALUE.match('%s' % value):
+                    raise ImproperlyConfigured(
+                        'Invalid sqlite pragma %s = %s' % (name, value))
+                cursor.execute('PRAGMA %s = %s' % (name, value))
+        finally:
+            cursor.close()
+
+    def _start_transaction_under_autocommit(self):
+        mode = self.settings_dict.get('TRANSACTION_MODE', 'IMMEDIATE')
+        self.cursor().execute('BEGIN %s' % mode)
+
+    def on_commit(self, func):
+        if self.in_atomic_block:
+            self.run_on_commit.append((set(self.savepoint_ids), func))
+        elif not self.get_autocommit():
+            raise TransactionManagementError(
+                "on_commit() cannot be used in manual transaction "
+                "management")
+        else:
+            func()
+
+    def run_and_clear_commit_hooks(self):
+        self.validate_no_atomic_block()
+        self.run_commit_hooks_on_autocommit = False
+        hooks, self.run_on_commit = self.run_on_commit, []
+        for sids, func in hooks:
+            func()
+
+    def commit(self):
+        super(DatabaseWrapper, self).commit()
+        if self.run_on_commit:
+            if self._autocommit:
+                self.run_and_clear_commit_hooks()
+            else:
+                self.run_commit_hooks_on_autocommit = True
+
+    def rollback(self):
+        super(DatabaseWrapper, self).rollback()
+        self.run_on_commit = []
+        self.run_commit_hooks_on_autocommit = False
+
+    def savepoint_rollback(self, sid):
+        super(DatabaseWrapper, self).savepoint_rollback(sid)
+        self.run_on_commit = [(sids, func) for sids, func
+                              in self.run_on_commit if sid not in sids]
+
+    def close(self):
+        in_transaction = self.in_atomic_block
+        super(DatabaseWrapper, self).close()
+        if in_transaction:
+            # the database rolls the transaction back
+            self.run_on_commit = []
+            self.run_commit_hooks_on_autocommit = False
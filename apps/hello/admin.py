@@ -3,9 +3,13 @@ from __future__ import unicode_literals
 from django.contrib import admin
 
 
-from .models import Person, RequestStore, NoteModel
+from .models import Person, RequestPath, RequestStore, RequestCounter
+from .models import RequestWatermark, NoteModel
 
 
 admin.site.register(Person)
+admin.site.register(RequestPath)
 admin.site.register(RequestStore)
+admin.site.register(RequestCounter)
+admin.site.register(RequestWatermark)
 admin.site.register(NoteModel)
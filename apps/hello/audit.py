@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections
+from django.utils import timezone
+
+import json
+import random
+import threading
+
+from .models import NoteModel
+from .buffers import BulkBuffer, buffer_options
+
+
+_actor = threading.local()
+
+
+def set_actor(request):
+    """Make the user of ``request`` the actor of changes in this thread."""
+    _actor.request = request
+
+
+def get_actor_id():
+    """Id of the user whose request runs in this thread, if any."""
+    user = getattr(getattr(_actor, 'request', None), 'user', None)
+    if user is not None and user.is_authenticated():
+        return user.pk
+    return None
+
+
+class AuditSink(object):
+    """
+    Records changes of models as NoteModel rows.
+
+    Records are queued in ``buffer`` (a BulkBuffer writing them with
+    ``bulk_create``) only once the transaction that made the change
+    commits, so rolled back changes are never recorded. Models listed
+    in ``AUDIT_LOG['EXCLUDE']`` aren't recorded, changes of models in
+    ``AUDIT_LOG['SAMPLE']`` are recorded with the given probability.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def is_recorded(self, model_name):
+        options = getattr(settings, 'AUDIT_LOG', {})
+        if model_name in options.get('EXCLUDE', ()):
+            return False
+        rate = options.get('SAMPLE', {}).get(model_name)
+        return rate is None or random.random() < rate
+
+    def record(self, sender, instance, action_type, using, changes=None):
+        if not self.is_recorded(sender.__name__):
+            return False
+        # cached by ContentTypeManager
+        content_type = ContentType.objects.get_for_model(sender)
+        note = NoteModel(model=sender.__name__,
+                         inst=unicode(instance)[:250],
+                         action_type=action_type,
+                         content_type=content_type,
+                         object_id=instance.pk,
+                         timestamp=timezone.now(),
+                         actor_id=get_actor_id(),
+                         changes=json.dumps(changes, separators=(',', ':'))
+                         if changes else '')
+
+        connection = connections[using]
+        if connection.in_atomic_block and hasattr(connection, 'on_commit'):
+            connection.on_commit(lambda: self.buffer.put(note))
+        else:
+            self.buffer.put(note)
+        return True
+
+    def flush(self):
+        return self.buffer.flush()
+
+
+audit_buffer = BulkBuffer(NoteModel.objects.bulk_create,
+                          **buffer_options('AUDIT_LOG_BUFFER'))
+audit_sink = AuditSink(audit_buffer)
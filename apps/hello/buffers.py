@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+from django.db import connections
+
+from collections import deque
+import atexit
+import logging
+import threading
+
+from .models import RequestStore
+from .feed import request_feed
+
+
+logger = logging.getLogger(__name__)
+
+
+class BulkBuffer(object):
+    """
+    Bounded in-process queue of unsaved model instances.
+
+    Instances are handed to ``writer`` (e.g. ``bulk_create``) in
+    batches of ``batch_size``, either by a background thread every
+    ``flush_interval`` seconds / as soon as a batch is full, or by an
+    explicit ``flush()``. When the buffer holds ``max_size`` instances
+    new ones are dropped and counted instead of blocking the caller.
+    """
+
+    def __init__(self, writer, max_size=10000, batch_size=100,
+                 flush_interval=1.0):
+        self.writer = writer
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def put(self, obj):
+        """Queue ``obj``; return False if the buffer is full."""
+        with self._lock:
+            if len(self._items) >= self.max_size:
+                self.dropped += 1
+                return False
+            self._items.append(obj)
+            full = len(self._items) >= self.batch_size
+
+        self.start()
+        if full:
+            self._wakeup.set()
+        return True
+
+    def flush(self):
+        """Write everything queued so far, return number of saved objects."""
+        saved = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    count = min(self.batch_size, len(self._items))
+                    batch = [self._items.popleft() for i in range(count)]
+                if not batch:
+                    break
+                try:
+                    self.writer(batch)
+                except Exception:
+                    logger.exception('Failed to write %d buffered objects',
+                                     len(batch))
+                    with self._lock:
+                        self.failed += len(batch)
+                else:
+                    saved += len(batch)
+                    with self._lock:
+                        self.flushed += len(batch)
+        return saved
+
+    def clear(self):
+        """Drop everything queued so far, return number of dropped objects."""
+        with self._lock:
+            count = len(self._items)
+            self._items.clear()
+        return count
+
+    def start(self):
+        """Start the background flusher, unless it runs or is disabled."""
+        if self._thread is not None or not self.flush_interval:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run,
+                                            name='BulkBuffer')
+            self._thread.daemon = True
+            self._thread.start()
+        atexit.register(self.drain)
+
+    def drain(self, timeout=5.0):
+        """Stop the background flusher and write what is left."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and \
+                self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        return self.flush()
+
+    def stats(self):
+        with self._lock:
+            return {'pending': len(self._items),
+                    'flushed': self.flushed,
+                    'dropped': self.dropped,
+                    'failed': self.failed}
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                self.flush()
+        finally:
+            # the flusher owns connections of its own
+            for connection in connections.all():
+                connection.close()
+
+
+def buffer_options(setting):
+    """BulkBuffer arguments from a REQUEST_LOG_BUFFER like setting."""
+    options = getattr(settings, setting, {})
+    return dict(max_size=options.get('MAX_SIZE', 10000),
+                batch_size=options.get('BATCH_SIZE', 100),
+                flush_interval=options.get('FLUSH_INTERVAL', 1.0))
+
+
+def _log_requests(requests):
+    RequestStore.objects.log(requests)
+    request_feed.notify()
+
+
+request_buffer = BulkBuffer(_log_requests,
+                            **buffer_options('REQUEST_LOG_BUFFER'))
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import threading
+import time
+
+from .models import RequestStore
+
+
+class RequestFeed(object):
+    """
+    Lets long-poll requests wait for RequestStore rows newer than a
+    cursor (the last request id a client has seen).
+
+    Writers in this process wake the waiting requests with ``notify()``.
+    Rows written by other processes are found by rechecking the newest
+    id every ``interval`` seconds, which is a lookup on the primary key.
+    """
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._condition = threading.Condition()
+
+    def last_id(self):
+        return RequestStore.objects.last_id()
+
+    def notify(self):
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait(self, cursor, timeout):
+        """
+        Return id of the newest request once it is greater than
+        ``cursor``, or None if that didn't happen within ``timeout``.
+        """
+        deadline = time.time() + timeout
+        while True:
+            last_id = self.last_id()
+            if last_id > cursor:
+                return last_id
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            with self._condition:
+                self._condition.wait(min(remaining, self.interval))
+
+
+request_feed = RequestFeed()
@@ -6,9 +6,18 @@ from django import forms
 from .models import Person
 
 
+JQUERY_UI = 'jquery-ui-1.13.2/'
+JQUERY_VALIDATION = 'jquery-validation-1.19.3/'
+
+
 class CalendarWidget(forms.DateInput):
     class Media:
-        js = ('http://code.jquery.com/ui/1.11.0/jquery-ui.js',)
+        css = {'all': (JQUERY_UI + 'themes/base/core.min.css',
+                       JQUERY_UI + 'themes/base/datepicker.min.css',
+                       JQUERY_UI + 'themes/base/theme.min.css')}
+        js = (JQUERY_UI + 'ui/version.min.js',
+              JQUERY_UI + 'ui/keycode.min.js',
+              JQUERY_UI + 'ui/widgets/datepicker.min.js')
 
     def __init__(self, attrs={}):
         super(CalendarWidget, self).__init__(
@@ -32,4 +41,6 @@ class PersonForm(ModelForm):
         }
 
     class Media:
-        js = ('js/change_contact.js',)
+        js = (JQUERY_VALIDATION + 'jquery.validate.min.js',
+              JQUERY_VALIDATION + 'additional-methods.min.js',
+              'js/change_contact.js')
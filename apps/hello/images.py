@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+from multiprocessing.pool import ThreadPool
+from PIL import Image as Img
+import StringIO
+import hashlib
+import json
+import logging
+import threading
+
+from .pagecache import home_card_cache
+
+
+logger = logging.getLogger(__name__)
+
+# boxes thumbnails are built for, largest first; Person.thumbnail
+# (the <img src> fallback) is the THUMBNAIL_SIZE one
+THUMBNAIL_SIZES = (400, 200, 100)
+THUMBNAIL_SIZE = 200
+
+# (PIL format, file extension, mime type, save options)
+THUMBNAIL_FORMATS = (
+    ('JPEG', 'jpg', 'image/jpeg', {'quality': 75, 'progressive': True}),
+    ('WEBP', 'webp', 'image/webp', {'quality': 75}),
+)
+
+
+def thumbnail_formats():
+    """THUMBNAIL_FORMATS the installed Pillow can write."""
+    Img.init()
+    return [fmt for fmt in THUMBNAIL_FORMATS if fmt[0] in Img.SAVE]
+
+
+def open_image(fp, box=THUMBNAIL_SIZES[0]):
+    """
+    Read header of the photo in ``fp``. JPEGs are set to be decoded
+    already scaled down (by 1/2 - 1/8) as long as they still cover
+    ``box``, which is all the thumbnails need.
+    """
+    image = Img.open(fp)
+    image.draft(image.mode, (box, box))
+    return image
+
+
+def decode_size(image):
+    """Bytes taken by pixels of the opened ``image`` once decoded."""
+    return image.size[0] * image.size[1] * len(image.getbands())
+
+
+def check_decode_size(image):
+    limit = getattr(settings, 'IMAGE_MAX_DECODE_SIZE', 64 * 1024 * 1024)
+    if decode_size(image) > limit:
+        raise ValidationError('Photo is too large, it takes over %d MB '
+                              'to process.' % (limit // (1024 * 1024)),
+                              code='too_large')
+
+
+def validate_image(value):
+    """Reject uploads whose decoding would exceed the memory ceiling."""
+    if getattr(value, '_committed', False):
+        return
+    value.seek(0)
+    try:
+        image = open_image(value)
+    except IOError:
+        # not an image, reported by the form field
+        return
+    finally:
+        value.seek(0)
+    check_decode_size(image)
+
+
+def content_hash(field_file):
+    """sha1 of the file contents, read in chunks."""
+    sha1 = hashlib.sha1()
+    field_file.seek(0)
+    for chunk in field_file.chunks():
+        sha1.update(chunk)
+    field_file.seek(0)
+    return sha1.hexdigest()
+
+
+def thumbnail_name(image_hash, size, extension):
+    """Content-addressed name, the file never changes once written."""
+    return '%s-%d.%s' % (image_hash, size, extension)
+
+
+def render_thumbnails(field_file, sizes=THUMBNAIL_SIZES, formats=None):
+    """
+    Decode the photo once and yield ``(size, format, (width, height),
+    bytes)`` for every box in ``sizes`` (largest first) and format.
+    The photo is never enlarged, boxes bigger than it get its own size.
+
+    The file is read straight from storage, and only the reduced
+    pixels of a JPEG are kept in memory.
+    """
+    formats = thumbnail_formats() if formats is None else formats
+    field_file.open('rb')
+    try:
+        image = open_image(field_file, sizes[0])
+        check_decode_size(image)
+        image.load()
+    finally:
+        field_file.close()
+    if image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    for size in sizes:
+        # each size is reduced from the previous, larger one
+        image.thumbnail((size, size), Img.ANTIALIAS)
+        for fmt in formats:
+            output = StringIO.StringIO()
+            image.save(output, format=fmt[0], **fmt[3])
+            yield size, fmt, image.size, output.getvalue()
+
+
+def make_thumbnail(person_id, image_hash):
+    """
+    Build thumbnails of the photo of person ``person_id`` and mark them
+    ready. Nothing is stored if the photo was replaced in the meantime.
+
+    Thumbnails are named after ``image_hash``, so ones that exist
+    already are reused.
+    """
+    from .models import Person
+
+    person = Person.objects.filter(pk=person_id, image_hash=image_hash)\
+                           .first()
+    if person is None or not person.image:
+        return False
+
+    field = person.thumbnail.field
+    storage = person.thumbnail.storage
+    thumbnails = []
+    for size, fmt, (width, height), content in \
+            render_thumbnails(person.image):
+        name = field.generate_filename(
+            person, thumbnail_name(image_hash, size, fmt[1]))
+        if not storage.exists(name):
+            name = storage.save(name, ContentFile(content))
+        thumbnails.append({'name': name, 'type': fmt[2], 'size': size,
+                           'width': width, 'height': height})
+
+    default = [t for t in thumbnails
+               if t['size'] == THUMBNAIL_SIZE and t['type'] == 'image/jpeg']
+    updated = Person.objects.filter(pk=person_id, image_hash=image_hash)\
+                            .update(thumbnail=default[0]['name'],
+                                    width=default[0]['width'],
+                                    height=default[0]['height'],
+                                    thumbnails=json.dumps(thumbnails),
+                                    image_ready=True)
+    if updated:
+        # update() sends no post_save, the thumbnails show from now on
+        Person.objects.changed()
+        home_card_cache.changed()
+    return bool(updated)
+
+
+def delete_orphans(names):
+    """Delete photo files of ``names`` no person refers to any more."""
+    from .models import Person
+
+    storage = Person._meta.get_field('image').storage
+    deleted = []
+    for name in names:
+        if Person.objects.filter(models.Q(image=name) |
+                                 models.Q(thumbnail=name) |
+                                 models.Q(thumbnails__contains='"%s"' % name))\
+                         .exists():
+            continue
+        storage.delete(name)
+        deleted.append(name)
+    return deleted
+
+
+class ImagePipeline(object):
+    """
+    Runs ``make_thumbnail`` for saved photos in a pool of worker threads,
+    so the request that uploaded a photo doesn't wait for it. Other
+    file work, like deleting replaced photos, is run there too.
+
+    The pool size is ``IMAGE_PIPELINE_WORKERS``; with 0 photos are
+    processed at once in the calling thread. Workers read through
+    connections of their own, so jobs for changes made in a transaction
+    are queued once it commits, and dropped if it rolls back.
+    """
+
+    def __init__(self, task=make_thumbnail):
+        self.task = task
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self):
+        return getattr(settings, 'IMAGE_PIPELINE_WORKERS', 2)
+
+    def submit(self, person_id, image_hash, using=None):
+        if not self.workers:
+            # in the transaction that saved the photo
+            return self.task(person_id, image_hash)
+        self.after_commit(using, self.task, person_id, image_hash)
+
+    def run(self, func, *args):
+        if not self.workers:
+            return func(*args)
+        self.pool().apply_async(self._run, (func, args))
+
+    def after_commit(self, using, func, *args):
+        """Run ``func`` once the transaction open on ``using`` commits."""
+        connection = connections[using or DEFAULT_DB_ALIAS]
+        if connection.in_atomic_block and hasattr(connection, 'on_commit'):
+            connection.on_commit(lambda: self.run(func, *args))
+        else:
+            self.run(func, *args)
+
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPool(self.workers)
+            return self._pool
+
+    def _run(self, func, args):
+        try:
+            func(*args)
+        except Exception:
+            logger.exception('Failed to run %s%r', func.__name__, args)
+        finally:
+            # workers own connections of their own
+            for connection in connections.all():
+                connection.close()
+
+
+image_pipeline = ImagePipeline()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.core.management.base import NoArgsCommand, CommandError
+from django.db import connection
+from django.template import Context, Template
+from django.test.utils import CaptureQueriesContext
+
+from optparse import make_option
+import timeit
+
+from apps.hello.models import Person
+from apps.hello.templatetags.edit_link import admin_change_url, change_urls
+
+
+class Command(NoArgsCommand):
+    help = "Time the edit_link template tag: its url lookup alone and " \
+           "the rendered tag, per call and with queries made."
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--number',
+                    type='int',
+                    dest='number',
+                    default=10000,
+                    help='Calls timed'),
+    )
+
+    def handle_noargs(self, **options):
+        person = Person.objects.first()
+        if person is None:
+            raise CommandError('There is no person to link to')
+        number = options['number']
+        # the url table is built on first use, not timed
+        change_urls()
+        template = Template('{% load edit_link %}{% edit_link person %}')
+        context = Context({'person': person})
+
+        for name, func in (
+                ('admin_change_url', lambda: admin_change_url(person)),
+                ('{% edit_link %}', lambda: template.render(context))):
+            with CaptureQueriesContext(connection) as queries:
+                elapsed = timeit.timeit(func, number=number)
+            self.stdout.write("%s: %.2f us per call, %d queries in %d calls"
+                              % (name, elapsed * 1e6 / number,
+                                 len(queries), number))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.core.management.base import NoArgsCommand
+from django.conf import settings
+from django.db import router
+from django.utils import timezone
+
+from datetime import timedelta
+from optparse import make_option
+import time
+
+from apps.hello.models import RequestStore
+
+
+class Command(NoArgsCommand):
+    help = "Delete stored requests older than retention window. " \
+           "They stay counted in RequestPath and RequestCounter rollups, " \
+           "which are maintained as requests are logged."
+
+    option_list = NoArgsCommand.option_list + (
+        make_option('--days',
+                    type='int',
+                    dest='days',
+                    default=None,
+                    help='Keep requests of that many last days '
+                         '(REQUEST_RETENTION_DAYS by default)'),
+        make_option('--chunk-size',
+                    type='int',
+                    dest='chunk_size',
+                    default=1000,
+                    help='Requests deleted per transaction'),
+        make_option('--pause',
+                    type='float',
+                    dest='pause',
+                    default=0,
+                    help='Seconds to sleep between chunks'),
+    )
+
+    def handle_noargs(self, **options):
+        days = options['days']
+        if days is None:
+            days = getattr(settings, 'REQUEST_RETENTION_DAYS', 30)
+        chunk_size = options['chunk_size']
+        cutoff = timezone.now() - timedelta(days=days)
+
+        old = RequestStore.objects.filter(date__lt=cutoff).order_by('id')
+        using = router.db_for_write(RequestStore)
+        deleted = 0
+        started = time.time()
+
+        while True:
+            ids = list(old.values_list('id', flat=True)[:chunk_size])
+            if not ids:
+                break
+            # no per-row delete signals: requests aren't audited one by one
+            RequestStore.objects.filter(id__in=ids)._raw_delete(using)
+            deleted += len(ids)
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        elapsed = time.time() - started
+        self.stdout.write("Deleted %d requests older than %s in %.2fs "
+                          "(%d rows/s)" %
+                          (deleted, cutoff.strftime('%Y-%m-%d %H:%M'),
+                           elapsed, deleted / elapsed if elapsed else 0))
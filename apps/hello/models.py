@@ -1,15 +1,164 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.conf import settings
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.fields.files import FieldFile
+from django.dispatch import Signal
+from django.utils import timezone
 
-from PIL import Image as Img
-import StringIO
+import json
 import os
+import threading
+import time
 
+from .images import content_hash, delete_orphans, image_pipeline
+from .images import validate_image
+from .pagecache import home_card_cache
 
-class Person(models.Model):
+
+class DirtyFieldsMixin(object):
+    """
+    Remembers field values an instance was loaded or last saved with,
+    so changed fields are known without reading the row again.
+
+    ``save()`` of a stored instance writes only the changed fields, and
+    nothing at all if none changed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(DirtyFieldsMixin, self).__init__(*args, **kwargs)
+        self._snapshot()
+
+    def _snapshot(self):
+        # deferred fields aren't loaded, so they aren't tracked
+        self._loaded_values = dict(
+            (field.attname, self._tracked_value(field))
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__)
+
+    def _tracked_value(self, field):
+        value = self.__dict__.get(field.attname)
+        if isinstance(value, FieldFile):
+            # a new upload is a change even if it has the same name
+            return value.name if value._committed else value.file
+        return value
+
+    def changed_fields(self):
+        """Names of fields changed since the instance was loaded."""
+        changed = []
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue
+            if field.attname not in self._loaded_values or \
+                    self._tracked_value(field) != \
+                    self._loaded_values[field.attname]:
+                changed.append(field.name)
+        return changed
+
+    def changed_values(self):
+        """Changed fields with their new values as strings."""
+        return dict((name, self._meta.get_field(name).value_to_string(self))
+                    for name in self.changed_fields())
+
+    def save(self, *args, **kwargs):
+        if kwargs.get('update_fields') is None and self.pk is not None \
+                and not self._state.adding and not kwargs.get('force_insert'):
+            changed = self.changed_fields()
+            if changed:
+                changed.extend(field.name for field in self._meta.fields
+                               if getattr(field, 'auto_now', False))
+            kwargs['update_fields'] = changed
+        super(DirtyFieldsMixin, self).save(*args, **kwargs)
+        self._snapshot()
+
+
+# sent by Person.objects.primary(), ``hit`` tells if memory served it
+person_cache_lookup = Signal(providing_args=['hit'])
+
+
+class PersonManager(models.Manager):
+    """
+    ``primary()`` serves the contact shown by the site from a copy kept
+    in process memory. The copy is read again after PERSON_CACHE_TTL
+    seconds or when the version counter in the cache changes, which
+    ``changed()`` does on every save, so workers sharing a cache backend
+    see the change at once.
+
+    The counter is kept in the cache of the home page card, so a worker
+    rendering the card of a new version never does it from a copy that
+    is older than the version.
+    """
+    version_key = 'hello:person:version'
+    version_timeout = 60 * 60 * 24
+
+    def __init__(self):
+        super(PersonManager, self).__init__()
+        # (version, loaded at, field values or None)
+        self._primary = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'PERSON_CACHE_TTL', 60)
+
+    @property
+    def cache(self):
+        return home_card_cache.cache
+
+    def primary(self):
+        """The first person, a fresh instance on every call, or None."""
+        entry = self._primary
+        hit = entry is not None and \
+            time.time() - entry[1] <= self.ttl and \
+            self.cache.get(self.version_key) == entry[0]
+        if not hit:
+            entry = self._load()
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        person_cache_lookup.send(sender=self.model, hit=hit)
+
+        if entry[2] is None:
+            return None
+        # callers, like forms, change the instance they get
+        person = self.model(*entry[2])
+        person._state.adding = False
+        person._state.db = self.db
+        return person
+
+    def changed(self):
+        """Make every process read the primary person again."""
+        with self._lock:
+            self._primary = None
+        self.cache.add(self.version_key, 0, self.version_timeout)
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            # evicted between add() and incr(), that is a change too
+            pass
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def _load(self):
+        version = self.cache.get(self.version_key)
+        # the row as the queryset would give it to Person()
+        values = self.values_list(*[field.attname for field in
+                                    self.model._meta.concrete_fields])\
+                     .first()
+        entry = (version, time.time(), values)
+        with self._lock:
+            self._primary = entry
+        return entry
+
+
+class Person(DirtyFieldsMixin, models.Model):
     name = models.CharField('name', max_length=250)
     surname = models.CharField('surname', max_length=250)
     date_of_birth = models.DateField('date of birth')
@@ -24,46 +173,240 @@ class Person(models.Model):
                               blank=True,
                               null=True,
                               upload_to='photo/',
-                              height_field='height',
-                              width_field='width')
+                              validators=[validate_image])
+    # sha1 of the uploaded photo, thumbnail is built from it in background
+    image_hash = models.CharField(max_length=40, blank=True, editable=False)
+    image_ready = models.BooleanField(default=False, editable=False)
+    thumbnail = models.ImageField('thumbnail',
+                                  blank=True,
+                                  null=True,
+                                  editable=False,
+                                  upload_to='photo/thumbnail/',
+                                  height_field='height',
+                                  width_field='width')
+    # json list of all thumbnails: name, type, size, width, height
+    thumbnails = models.TextField(blank=True, editable=False)
     height = models.PositiveIntegerField(default=1, null=True, blank=True)
     width = models.PositiveIntegerField(default=1,  null=True, blank=True)
+    modified = models.DateTimeField('modified', auto_now=True, null=True)
+
+    objects = PersonManager()
+
+    # fields derived from the photo, saved along with it
+    IMAGE_FIELDS = ('image', 'image_hash', 'image_ready', 'thumbnail',
+                    'thumbnails', 'width', 'height')
 
     def save(self, *args, **kwargs):
-        if self.image:
-            image = Img.open(StringIO.StringIO(self.image.read()))
-            image.thumbnail((200, 200), Img.ANTIALIAS)
-            output = StringIO.StringIO()
-            image.save(output, format='JPEG', quality=75)
-            output.seek(0)
-            self.image = InMemoryUploadedFile(output,
-                                              'ImageField',
-                                              "%s" % self.image.name,
-                                              'image/jpeg',
-                                              output.len,
-                                              None)
+        """
+        Save the person; with ``update_fields`` only those fields (and
+        ``modified``) are written and the photo is left alone unless
+        'image' is one of them.
+
+        A new photo is handed to the image pipeline, files of the
+        replaced one are deleted there once the save commits.
+        """
+        update_fields = kwargs.get('update_fields')
+        process = False
+        replaced = []
+        if update_fields is None or 'image' in update_fields:
+            process, replaced = self._update_image()
+        if update_fields is not None:
+            update_fields = set(update_fields) | set(['modified'])
+            if 'image' in update_fields:
+                update_fields.update(self.IMAGE_FIELDS)
+            kwargs['update_fields'] = update_fields
+
         super(Person, self).save(*args, **kwargs)
+        if replaced:
+            # files are kept if the save is rolled back
+            image_pipeline.after_commit(self._state.db, delete_orphans,
+                                        replaced)
+        if process:
+            image_pipeline.submit(self.pk, self.image_hash,
+                                  using=self._state.db)
+
+    def _update_image(self):
+        """
+        Reset fields derived from the photo if it was changed. Return
+        whether it needs processing and names of replaced files.
+        """
+        if not self._state.adding and 'image' not in self.changed_fields():
+            return False, []
+        if self.image and self.image._committed:
+            return False, []
+
+        # derived fields are updated by the pipeline behind this
+        # instance's back, so they are read fresh
+        stored = None
+        if self.pk is not None:
+            stored = Person.objects.filter(pk=self.pk)\
+                                   .values_list(*self.IMAGE_FIELDS).first()
+        stored = dict(zip(self.IMAGE_FIELDS, stored or ()))
+        stored_image = stored.get('image')
+        stored_thumbnails = stored.get('thumbnails')
+
+        image_hash = content_hash(self.image) if self.image else ''
+        if stored_image and image_hash == stored['image_hash']:
+            # same content, keep the stored file and thumbnails
+            for field in self.IMAGE_FIELDS:
+                setattr(self, field, stored[field])
+            # processed again if its thumbnails were never made
+            return not stored['image_ready'], []
+
+        self.image_hash = image_hash
+        self.image_ready = False
+        self.thumbnail = None
+        self.thumbnails = ''
+        replaced = []
+        if stored_image:
+            replaced.append(stored_image)
+        if stored_thumbnails:
+            replaced.extend(t['name'] for t in json.loads(stored_thumbnails))
+        return bool(self.image), replaced
 
     def delete(self, *args, **kwargs):
         if self.image:
             if os.path.isfile(self.image.path):
                 os.remove(self.image.path)
+        for thumbnail in self.thumbnail_set():
+            self.thumbnail.storage.delete(thumbnail['name'])
 
         super(Person, self).delete(*args, **kwargs)
 
+    def thumbnail_set(self):
+        """Thumbnails of the photo, once they are ready."""
+        if not self.image_ready or not self.thumbnails:
+            return []
+        return json.loads(self.thumbnails)
+
     def __unicode__(self):
         return '%s %s' % (self.surname, self.name)
 
 
+class RequestPathManager(models.Manager):
+    def count_hits(self, requests):
+        """Add saved ``requests`` to hit counters of their paths."""
+        hits = {}
+        for req in requests:
+            count, last_hit = hits.get(req.request_path_id, (0, req.date))
+            hits[req.request_path_id] = (count + 1, max(last_hit, req.date))
+
+        for path_id, (count, last_hit) in hits.items():
+            self.filter(pk=path_id).update(hits=models.F('hits') + count,
+                                           last_hit=last_hit)
+
+
+class RequestPath(DirtyFieldsMixin, models.Model):
+    path = models.CharField(max_length=250, unique=True)
+    priority = models.PositiveIntegerField(default=0)
+    hits = models.PositiveIntegerField(default=0)
+    last_hit = models.DateTimeField(blank=True, null=True)
+
+    objects = RequestPathManager()
+
+    def __unicode__(self):
+        return self.path
+
+
+class RequestCounterManager(models.Manager):
+    def count_hits(self, requests):
+        """Add saved ``requests`` to per path, method and hour counters."""
+        hits = {}
+        for req in requests:
+            if req.request_path_id is None:
+                continue
+            hour = req.date.replace(minute=0, second=0, microsecond=0)
+            key = (req.request_path_id, req.method, hour)
+            hits[key] = hits.get(key, 0) + 1
+
+        for (path_id, method, hour), count in hits.items():
+            counters = self.filter(request_path=path_id,
+                                   method=method,
+                                   hour=hour)
+            if counters.update(hits=models.F('hits') + count):
+                continue
+            try:
+                with transaction.atomic(using=self.db):
+                    self.create(request_path_id=path_id,
+                                method=method,
+                                hour=hour,
+                                hits=count)
+            except IntegrityError:
+                # created by another worker meanwhile
+                counters.update(hits=models.F('hits') + count)
+
+    def top_paths(self, since=None, until=None, limit=10):
+        """``(path, hits)`` pairs of the most requested paths."""
+        return self._between(since, until)\
+                   .values_list('request_path__path')\
+                   .annotate(hits=models.Sum('hits'))\
+                   .order_by('-hits')[:limit]
+
+    def hits_per_hour(self, path, since=None, until=None):
+        """``(hour, hits)`` pairs of requests to ``path``, all methods."""
+        return self._between(since, until)\
+                   .filter(request_path__path=path)\
+                   .values_list('hour')\
+                   .annotate(hits=models.Sum('hits'))\
+                   .order_by('hour')
+
+    def _between(self, since, until):
+        counters = self.all()
+        if since is not None:
+            counters = counters.filter(hour__gte=since)
+        if until is not None:
+            counters = counters.filter(hour__lt=until)
+        return counters
+
+
+class RequestCounter(models.Model):
+    request_path = models.ForeignKey(RequestPath, related_name='counters')
+    method = models.CharField(max_length=10)
+    hour = models.DateTimeField()
+    hits = models.PositiveIntegerField(default=0)
+
+    objects = RequestCounterManager()
+
+    def __unicode__(self):
+        return "%s - %s %s: %d" % (self.request_path_id, self.method,
+                                   self.hour, self.hits)
+
+    class Meta:
+        unique_together = (('request_path', 'method', 'hour'),)
+
+
+class RequestStoreManager(models.Manager):
+    def last_id(self):
+        """Id of the newest request, a lookup on the primary key."""
+        return self.aggregate(last_id=models.Max('id'))['last_id'] or 0
+
+    def log(self, requests):
+        """Save a batch of requests linked to their RequestPath."""
+        self.bulk_create(requests)
+        self.count_hits(requests)
+
+    def count_hits(self, requests):
+        """Add saved ``requests`` to per path and per hour counters."""
+        RequestPath.objects.count_hits(requests)
+        RequestCounter.objects.count_hits(requests)
+
+
 class RequestStore(models.Model):
     path = models.CharField(max_length=250)
+    request_path = models.ForeignKey(RequestPath,
+                                     blank=True,
+                                     null=True,
+                                     related_name='requests')
     method = models.CharField(max_length=10)
+    # users are in another database, see signals.user_deleted
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              blank=True,
-                             null=True)
-    date = models.DateTimeField(auto_now_add=True)
-    new_request = models.PositiveIntegerField(default=1)
-    priority = models.PositiveIntegerField(default=0)
+                             null=True,
+                             on_delete=models.DO_NOTHING,
+                             db_constraint=False)
+    date = models.DateTimeField(default=timezone.now, db_index=True)
+
+    objects = RequestStoreManager()
 
     def __unicode__(self):
         return "%s - %s" % (self.path, self.method)
@@ -72,6 +415,64 @@ class RequestStore(models.Model):
         ordering = ["-date"]
 
 
+class RequestWatermarkManager(models.Manager):
+    def last_seen(self):
+        """
+        Id of the newest request seen on the requests page, a lookup on
+        the primary key; it isn't cached, so every worker sees it move.
+        """
+        return self.filter(pk=1).values_list('last_id', flat=True)\
+                   .first() or 0
+
+    def mark_seen(self, last_id):
+        """Mark requests up to ``last_id`` as seen with one row write."""
+        if self.filter(pk=1).update(last_id=last_id):
+            return
+        try:
+            with transaction.atomic(using=self.db):
+                self.create(pk=1, last_id=last_id)
+        except IntegrityError:
+            # created by another worker meanwhile
+            self.filter(pk=1).update(last_id=last_id)
+
+    def unseen(self):
+        """Number of requests made after the requests page was viewed."""
+        return max(RequestStore.objects.last_id() - self.last_seen(), 0)
+
+
+class RequestWatermark(models.Model):
+    last_id = models.PositiveIntegerField(default=0)
+
+    objects = RequestWatermarkManager()
+
+    def __unicode__(self):
+        return "seen up to %d" % self.last_id
+
+
+class NoteModelManager(models.Manager):
+    def history(self, obj, since=None, until=None):
+        """Records of ``obj``, oldest first."""
+        content_type = ContentType.objects.get_for_model(obj)
+        return self._between(since, until)\
+                   .filter(content_type=content_type, object_id=obj.pk)\
+                   .order_by('timestamp')
+
+    def for_model(self, model, since=None, until=None):
+        """Records of all instances of ``model``, oldest first."""
+        content_type = ContentType.objects.get_for_model(model)
+        return self._between(since, until)\
+                   .filter(content_type=content_type)\
+                   .order_by('timestamp')
+
+    def _between(self, since, until):
+        notes = self.all()
+        if since is not None:
+            notes = notes.filter(timestamp__gte=since)
+        if until is not None:
+            notes = notes.filter(timestamp__lt=until)
+        return notes
+
+
 class NoteModel(models.Model):
     ACTION_TYPE = (
         (0, 'created'),
@@ -83,6 +484,31 @@ class NoteModel(models.Model):
     action_type = models.PositiveIntegerField('action type',
                                               max_length=1,
                                               choices=ACTION_TYPE)
+    # content types and users are in another database, see
+    # signals.user_deleted
+    content_type = models.ForeignKey(ContentType,
+                                     null=True,
+                                     blank=True,
+                                     on_delete=models.DO_NOTHING,
+                                     db_constraint=False)
+    object_id = models.PositiveIntegerField(null=True, blank=True)
+    # null for records made before timestamps were kept
+    timestamp = models.DateTimeField(default=timezone.now, null=True)
+    actor = models.ForeignKey(settings.AUTH_USER_MODEL,
+                              null=True,
+                              blank=True,
+                              on_delete=models.DO_NOTHING,
+                              db_constraint=False)
+    # json object of changed fields: name -> new value
+    changes = models.TextField(blank=True)
+
+    objects = NoteModelManager()
+
+    class Meta:
+        index_together = [
+            ('content_type', 'object_id', 'timestamp'),
+            ('content_type', 'timestamp'),
+        ]
 
     def __unicode__(self):
         return "%s  %s: %s " % (self.model,
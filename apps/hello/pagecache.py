@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+from django.core.cache import get_cache
+from django.core.cache.backends.filebased import FileBasedCache
+
+import errno
+import hashlib
+import os
+import time
+
+
+class FragmentCache(object):
+    """
+    Rendered page fragments of a model, keyed on a version counter that
+    ``changed()`` bumps whenever an instance of the model is saved or
+    deleted, so a cached fragment never has to be looked for and deleted.
+
+    Fragments and the version live in the ``HOME_PAGE_CACHE['ALIAS']``
+    cache. The default in-process LocMem cache only sees changes made by
+    its own process; with several workers use a cache they share, like
+    the file-based 'files' one.
+
+    Against stampedes the fragment of a version is rendered by the one
+    request that got its lock, the others wait for it. A fragment older
+    than ``TIMEOUT`` is rendered again the same way, meanwhile the old
+    one is served. The lock is ``cache.add()``, which is atomic in LocMem
+    and memcached; FileBasedCache checks and writes in two steps, so
+    with it the lock is a file created with O_EXCL in the cache dir.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.version_key = 'hello:%s:version' % name
+        self._cache = None
+        self._alias = None
+
+    @property
+    def options(self):
+        return getattr(settings, 'HOME_PAGE_CACHE', {})
+
+    @property
+    def cache(self):
+        alias = self.options.get('ALIAS', 'default')
+        if self._cache is None or self._alias != alias:
+            self._cache = get_cache(alias)
+            self._alias = alias
+        return self._cache
+
+    def version(self):
+        version = self.cache.get(self.version_key)
+        if version is None:
+            # a new counter doesn't start at the versions it had before
+            self.cache.add(self.version_key, int(time.time() * 1000), None)
+            version = self.cache.get(self.version_key)
+        return version
+
+    def changed(self):
+        """Make fragments of all earlier versions unreachable."""
+        self.cache.add(self.version_key, int(time.time() * 1000), None)
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            # evicted between add() and incr()
+            self.cache.add(self.version_key, int(time.time() * 1000), None)
+
+    def get(self, render, version=None):
+        """
+        Return fragment of the current (or given) ``version``, calling
+        ``render()`` to build it if it isn't cached yet.
+        """
+        if version is None:
+            version = self.version()
+        key = 'hello:%s:%s' % (self.name, version)
+        lock_key = key + ':lock'
+        timeout = self.options.get('TIMEOUT', 600)
+        lock_timeout = self.options.get('LOCK_TIMEOUT', 10)
+
+        deadline = time.time() + lock_timeout
+        while True:
+            entry = self.cache.get(key)
+            if entry is not None and entry[0] > time.time():
+                return entry[1]
+            if self._lock(lock_key, lock_timeout):
+                break
+            if entry is not None:
+                # somebody renders it again, the old one is still right
+                return entry[1]
+            if time.time() >= deadline:
+                # the request holding the lock is stuck or died
+                return render()
+            time.sleep(0.05)
+
+        try:
+            value = render()
+            # kept past its expiry to be served while it is rendered again
+            self.cache.set(key, (time.time() + timeout, value),
+                           timeout + lock_timeout)
+        finally:
+            self._unlock(lock_key)
+        return value
+
+    def forget(self):
+        self.cache.delete(self.version_key)
+
+    def _lock_file(self, key):
+        if not isinstance(self.cache, FileBasedCache):
+            return None
+        name = hashlib.md5(key.encode('utf-8')).hexdigest() + '.lock'
+        return os.path.join(self.cache._dir, name)
+
+    def _lock(self, key, timeout):
+        path = self._lock_file(key)
+        if path is None:
+            return self.cache.add(key, True, timeout)
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                # removed by cache.clear()
+                self.cache._createdir()
+                return False
+            if e.errno != errno.EEXIST:
+                raise
+        try:
+            if time.time() - os.path.getmtime(path) > timeout:
+                # left by a request that died, taken on the next try
+                os.remove(path)
+        except OSError:
+            pass
+        return False
+
+    def _unlock(self, key):
+        path = self._lock_file(key)
+        if path is None:
+            self.cache.delete(key)
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+home_card_cache = FragmentCache('home_card')
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+from django.core.cache import cache
+
+from collections import OrderedDict
+import threading
+import time
+
+from .models import RequestPath
+
+
+class PriorityRegistry(object):
+    """
+    Path -> (RequestPath id, priority) index kept in process memory.
+
+    Paths are looked up in the db on first use, by the unique index of
+    ``RequestPath.path``, paths requested for the first time are added
+    to the db. The index keeps ``size`` recently used paths only, so
+    404s and scanner junk don't make it grow for good.
+
+    A priority change bumps a version counter in the cache and leaves
+    the changed path under a key of its own. Registries which see a new
+    version read the changed paths again and keep all others, so workers
+    sharing a cache backend see changes made by each other at once.
+    An entry is read again once it is ``ttl`` seconds old, which is how
+    workers without a shared cache see them.
+    """
+    version_key = 'hello:priority:version'
+    change_key = 'hello:priority:change:%s'
+    version_timeout = 60 * 60 * 24
+    # more changes than that since the last look are not read one by one
+    max_changes = 100
+
+    def __init__(self, ttl=None, size=None):
+        self._ttl = ttl
+        self._size = size
+        self._paths = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'PRIORITY_REGISTRY_TTL', 5)
+
+    @property
+    def size(self):
+        if self._size is not None:
+            return self._size
+        return getattr(settings, 'PRIORITY_REGISTRY_SIZE', 10000)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def get(self, path):
+        return self._entry(path)[1]
+
+    def path_id(self, path):
+        """Return id of RequestPath for ``path``, creating it if needed."""
+        pk = self._entry(path)[0]
+        if pk is not None:
+            return pk
+
+        request_path, created = RequestPath.objects.get_or_create(path=path)
+        self._store(path, request_path.pk, request_path.priority)
+        return request_path.pk
+
+    def set(self, path, priority):
+        """Change priority of all requests to ``path``."""
+        RequestPath.objects.filter(path=path).update(priority=priority)
+        self._changed(path, priority)
+
+    def observe(self, path, priority):
+        """Take a priority saved by other code into account."""
+        if self.get(path) != priority:
+            self._changed(path, priority)
+
+    def clear(self):
+        with self._lock:
+            self._paths.clear()
+            self._version = None
+
+    def _entry(self, path):
+        self._sync()
+        with self._lock:
+            entry = self._paths.pop(path, None)
+            if entry is not None and time.time() - entry[2] <= self.ttl:
+                # most recently used last
+                self._paths[path] = entry
+                return entry
+        rows = RequestPath.objects.filter(path=path)\
+                                  .values_list('id', 'priority')
+        for pk, priority in rows:
+            return self._store(path, pk, priority)
+        # unknown paths are remembered too, until path_id() creates them
+        return self._store(path, None, 0)
+
+    def _store(self, path, pk, priority):
+        entry = (pk, priority, time.time())
+        with self._lock:
+            self._paths.pop(path, None)
+            self._paths[path] = entry
+            while len(self._paths) > self.size:
+                self._paths.popitem(last=False)
+        return entry
+
+    def _sync(self):
+        """Read paths changed by other registries since the last look."""
+        # a missing counter was evicted, or no priority changed yet
+        version = cache.get(self.version_key) or 0
+        known = self._version
+        if version == known:
+            return
+        changes = {}
+        if known is not None and 0 < version - known <= self.max_changes:
+            keys = [self.change_key % v for v in range(known + 1,
+                                                       version + 1)]
+            changes = cache.get_many(keys)
+            if len(changes) < len(keys):
+                # evicted, what changed is not known
+                changes = {}
+        with self._lock:
+            if self._version != known:
+                # synced by another thread meanwhile
+                return
+            if not changes:
+                self._paths.clear()
+            for path in changes.values():
+                self._paths.pop(path, None)
+            self._version = version
+
+    def _changed(self, path, priority):
+        self._sync()
+        cache.add(self.version_key, 0, self.version_timeout)
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            # evicted between add() and incr()
+            version = None
+        else:
+            cache.set(self.change_key % version, path, self.version_timeout)
+        with self._lock:
+            if path in self._paths:
+                pk = self._paths.pop(path)[0]
+                self._paths[path] = (pk, priority, time.time())
+            if version is not None and self._version == version - 1:
+                # no changes of others in between
+                self._version = version
+
+
+priority_registry = PriorityRegistry()
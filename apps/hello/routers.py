@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+
+
+class LogRouter(object):
+    """
+    Keeps request and audit logs in a database of their own.
+
+    Models of ``LOG_MODELS`` are read, written and synced on the
+    ``LOG_DATABASE`` alias, all others on ``default``, so log writes
+    never hold the lock of the database pages are read from. Models of
+    the two may refer to each other, such relations are kept without
+    database constraints. Frozen models of South data migrations are
+    routed by name, just like the models they are frozen from.
+    """
+    LOG_MODELS = frozenset(['hello.requeststore', 'hello.requestpath',
+                            'hello.requestcounter', 'hello.requestwatermark',
+                            'hello.notemodel'])
+    # apps with tables in every database, South keeps migration history
+    # of each database in it
+    SHARED_APPS = frozenset(['south'])
+
+    def alias(self):
+        alias = getattr(settings, 'LOG_DATABASE', 'logs')
+        return alias if alias in settings.DATABASES else 'default'
+
+    def is_log(self, model):
+        return '%s.%s' % (model._meta.app_label, model._meta.model_name) \
+            in self.LOG_MODELS
+
+    def route(self, model):
+        if model._meta.app_label in self.SHARED_APPS:
+            return None
+        return self.alias() if self.is_log(model) else 'default'
+
+    def db_for_read(self, model, **hints):
+        return self.route(model)
+
+    def db_for_write(self, model, **hints):
+        return self.route(model)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = set([obj1._state.db, obj2._state.db])
+        if databases <= set(['default', self.alias()]):
+            return True
+        return None
+
+    def allow_syncdb(self, db, model):
+        database = self.route(model)
+        if database is None:
+            return None
+        return db == database
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs tests with the background flushers of BulkBuffer turned off.
+
+    A flusher writes through a connection of its own, which in tests
+    isn't the test database, and drains the buffer at exit, once test
+    databases are destroyed. Tests flush or clear the buffers instead.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super(TestRunner, self).setup_test_environment(**kwargs)
+        from .audit import audit_buffer
+        from .buffers import request_buffer
+        for buffer in (audit_buffer, request_buffer):
+            buffer.flush_interval = None
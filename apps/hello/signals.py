@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+from django.conf import settings
 from django.db.models.signals import post_save, post_delete
+from django.db import connections
+from django.db.models import get_model
 from django.dispatch import receiver
 
-from .models import NoteModel
+from .models import NoteModel, Person, RequestPath, RequestStore
+from .registry import priority_registry
+from .audit import audit_sink
+from .pagecache import home_card_cache
 
 
 @receiver([post_save, post_delete],
@@ -13,6 +19,10 @@ def models_handler(sender, **kwargs):
         return
     if sender._meta.model_name == 'notemodel':
         return
+    # frozen models saved by data migrations aren't audited
+    if get_model(sender._meta.app_label, sender._meta.object_name) \
+            is not sender:
+        return
 
     instance = kwargs.get('instance')
     created = kwargs.get('created')
@@ -24,7 +34,55 @@ def models_handler(sender, **kwargs):
         else:
             action_type = 1
 
-    note = NoteModel(model=sender.__name__,
-                     inst=instance,
-                     action_type=action_type)
-    note.save()
+    # fields changed since the instance was loaded, see DirtyFieldsMixin
+    changes = None
+    if action_type == 1 and hasattr(instance, 'changed_values'):
+        changes = instance.changed_values()
+
+    audit_sink.record(sender, instance, action_type, kwargs.get('using'),
+                      changes)
+
+
+@receiver(post_save, sender=RequestPath,
+          dispatch_uid='request_priority')
+def priority_handler(sender, instance, **kwargs):
+    priority_registry.observe(instance.path, instance.priority)
+
+
+@receiver([post_save, post_delete], sender=Person,
+          dispatch_uid='person')
+def person_handler(sender, using=None, **kwargs):
+    _person_changed()
+    connection = connections[using]
+    if connection.in_atomic_block and hasattr(connection, 'on_commit'):
+        # reads made before the commit still see the old person
+        connection.on_commit(_person_changed)
+
+
+def _person_changed():
+    Person.objects.changed()
+    home_card_cache.changed()
+
+
+@receiver(post_delete, dispatch_uid='user_deleted')
+def user_deleted(sender, instance, using=None, **kwargs):
+    """
+    Deletes requests of a deleted user and unsets the actor of records,
+    log models refer to users of another database without constraints.
+    """
+    if '%s.%s' % (sender._meta.app_label, sender._meta.object_name) != \
+            settings.AUTH_USER_MODEL:
+        return
+
+    user_id = instance.pk
+
+    def forget_user():
+        RequestStore.objects.filter(user=user_id).delete()
+        NoteModel.objects.filter(actor=user_id).update(actor=None)
+
+    connection = connections[using]
+    if connection.in_atomic_block and hasattr(connection, 'on_commit'):
+        # the user is deleted once the transaction commits
+        connection.on_commit(forget_user)
+    else:
+        forget_user()
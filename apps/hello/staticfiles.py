@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.conf import settings
+from django.contrib.staticfiles.storage import CachedStaticFilesStorage
+from django.contrib.staticfiles.storage import StaticFilesStorage
+from django.core.files.base import ContentFile
+from django.utils import six
+from django.utils.encoding import force_bytes
+from django.utils.module_loading import import_by_path
+
+import gzip
+import json
+import os
+import posixpath
+import re
+import StringIO
+import time
+
+# collected files worth compressing
+GZIP_EXTENSIONS = ('.css', '.js', '.svg', '.eot', '.ttf', '.map')
+
+CSS_URL = re.compile(r"""url\(\s*(['"]?)\s*(.*?)\s*\1\s*\)""", re.IGNORECASE)
+CSS_COMMENT = re.compile(r'/\*[^!].*?\*/', re.DOTALL)
+
+
+_media_files = {}
+
+
+def bundles():
+    """
+    Bundle name -> names of the static files it is made of. A bundle
+    may be given as dotted path of a form or widget instead, its Media
+    js or css files are bundled then.
+    """
+    result = {}
+    for name, files in getattr(settings, 'STATIC_BUNDLES', {}).items():
+        if isinstance(files, six.string_types):
+            files = media_files(files, name.endswith('.css'))
+        result[name] = tuple(files)
+    return result
+
+
+def media_files(path, css=False):
+    """Js (or css) files of Media of form or widget class ``path``."""
+    if (path, css) not in _media_files:
+        media = import_by_path(path)().media
+        if css:
+            files = [f for medium in sorted(media._css)
+                     for f in media._css[medium]]
+        else:
+            files = list(media._js)
+        _media_files[path, css] = files
+    return _media_files[path, css]
+
+
+def minify_css(content):
+    """Drop comments (not /*! ones) and whitespace CSS doesn't need."""
+    content = CSS_COMMENT.sub('', content)
+    content = re.sub(r'\s+', ' ', content)
+    content = re.sub(r'\s*([{};,])\s*', r'\1', content)
+    content = re.sub(r':\s+', ':', content)
+    return content.replace(';}', '}').strip()
+
+
+def minify_js(content):
+    """
+    Drop indentation, empty lines and lines of // comments. That is
+    all that is safe without parsing JavaScript; strings continued on
+    the next line with a backslash are kept as they are.
+    """
+    lines = []
+    continued = False
+    for line in content.splitlines():
+        if not continued:
+            line = line.strip()
+            if not line or line.startswith('//'):
+                continue
+        else:
+            line = line.rstrip()
+        lines.append(line)
+        continued = line.endswith('\\')
+    return '\n'.join(lines)
+
+
+def minifier(name):
+    if name.endswith(('.min.js', '.min.css')):
+        return None
+    if name.endswith('.css'):
+        try:
+            import rcssmin
+            return rcssmin.cssmin
+        except ImportError:
+            return minify_css
+    if name.endswith('.js'):
+        try:
+            import rjsmin
+            return rjsmin.jsmin
+        except ImportError:
+            return minify_js
+    return None
+
+
+def rebase_css_urls(content, source, bundle):
+    """Make relative url()s of ``source`` point from ``bundle``'s dir."""
+    source_dir = posixpath.dirname(source)
+    bundle_dir = posixpath.dirname(bundle) or '.'
+
+    def rebase(match):
+        quote, url = match.groups()
+        if not url or url.startswith(('/', '#', 'data:', 'http:', 'https:')):
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(source_dir, url))
+        return 'url(%s%s%s)' % (quote,
+                                posixpath.relpath(target, bundle_dir),
+                                quote)
+
+    return CSS_URL.sub(rebase, content)
+
+
+class BundledStaticFilesStorage(CachedStaticFilesStorage):
+    """
+    ``collectstatic`` storage that, on top of copies of files named
+    after a hash of their contents:
+
+    * builds the STATIC_BUNDLES, concatenated and minified, from the
+      collected files they list;
+    * writes a ``.gz`` copy next to hashed css, js and font files, for
+      the web server to send to clients accepting gzip;
+    * saves the name -> hashed name map in ``staticfiles.json``, which
+      ``url()`` reads, so no file is hashed at run time.
+
+    Names aren't hashed with DEBUG or while there is no manifest, as
+    runserver serves files straight from STATICFILES_DIRS.
+    """
+    manifest_name = 'staticfiles.json'
+
+    def __init__(self, *args, **kwargs):
+        super(BundledStaticFilesStorage, self).__init__(*args, **kwargs)
+        self._hashed_files = None
+        self._build_id = None
+
+    def build_id(self):
+        """
+        Id of the deployed build, for validators of pages linking its
+        files: modification time of the manifest, which collectstatic
+        writes on every deploy, or start time of the process without one.
+        """
+        if self._build_id is None:
+            try:
+                built = os.path.getmtime(self.path(self.manifest_name))
+            except (OSError, NotImplementedError):
+                built = time.time()
+            self._build_id = '%x' % int(built * 1000)
+        return self._build_id
+
+    def hashed_files(self):
+        """The collected manifest, empty before the first collectstatic."""
+        if self._hashed_files is None:
+            try:
+                with self.open(self.manifest_name) as manifest:
+                    self._hashed_files = json.loads(manifest.read())
+            except (IOError, OSError, ValueError):
+                self._hashed_files = {}
+        return self._hashed_files
+
+    def url(self, name, force=False):
+        if force:
+            # hashes css references to other files while collecting
+            return super(BundledStaticFilesStorage, self).url(name, force)
+        hashed_name = name
+        if not settings.DEBUG:
+            hashed_name = self.hashed_files().get(name, name)
+        return StaticFilesStorage.url(self, hashed_name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        for name in sorted(bundles()):
+            try:
+                self.build_bundle(name, paths)
+            except KeyError as e:
+                yield name, None, ValueError('%s of bundle %s was not '
+                                             'collected' % (e, name))
+                return
+            paths[name] = (self, name)
+
+        hashed_files = {}
+        processed = super(BundledStaticFilesStorage, self)\
+            .post_process(paths, dry_run, **options)
+        for name, hashed_name, was_processed in processed:
+            if hashed_name is not None:
+                hashed_files[name] = hashed_name
+                if hashed_name.endswith(GZIP_EXTENSIONS):
+                    self.gzip(hashed_name)
+            yield name, hashed_name, was_processed
+
+        self._save_manifest(hashed_files)
+
+    def build_bundle(self, name, paths):
+        parts = []
+        for source in bundles()[name]:
+            storage, path = paths[source]
+            with storage.open(path) as source_file:
+                content = source_file.read().decode(settings.FILE_CHARSET)
+            if name.endswith('.css'):
+                content = rebase_css_urls(content, source, name)
+            minify = minifier(source)
+            if minify is not None:
+                content = minify(content)
+            parts.append(content)
+        # a script without a final ; must not run into the next one
+        separator = ';\n' if name.endswith('.js') else '\n'
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(force_bytes(separator.join(parts))))
+
+    def gzip(self, name):
+        with self.open(name) as original:
+            content = original.read()
+        output = StringIO.StringIO()
+        # no name and time in the header: same input, same bytes
+        with gzip.GzipFile(filename='', mode='wb', fileobj=output,
+                           compresslevel=9, mtime=0) as compressed:
+            compressed.write(content)
+        if output.tell() >= len(content):
+            return
+        if self.exists(name + '.gz'):
+            self.delete(name + '.gz')
+        self._save(name + '.gz', ContentFile(output.getvalue()))
+
+    def _save_manifest(self, hashed_files):
+        if self.exists(self.manifest_name):
+            self.delete(self.manifest_name)
+        self._save(self.manifest_name,
+                   ContentFile(json.dumps(hashed_files, indent=1,
+                                          sort_keys=True)))
+        self._hashed_files = hashed_files
+        self._build_id = None
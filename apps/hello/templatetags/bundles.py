@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.html import format_html_join
+
+from ..staticfiles import bundles
+
+
+register = template.Library()
+
+TAGS = {
+    '.css': '<link rel="stylesheet" href="{0}">',
+    '.js': '<script src="{0}"></script>',
+}
+
+
+@register.simple_tag
+def bundle(name):
+    """
+    <script> or <link> of the STATIC_BUNDLES bundle ``name`` once it is
+    collected, of the files it is made of with DEBUG or before that.
+    """
+    tag = TAGS[name[name.rindex('.'):]]
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', dict)()
+    if not settings.DEBUG and name in hashed_files:
+        names = [name]
+    else:
+        names = bundles()[name]
+    return format_html_join('\n', tag, ((staticfiles_storage.url(n),)
+                                        for n in names))
@@ -1,20 +1,55 @@
 # -*- coding: utf-8 -*-
 from django import template
 from django.db import models
-from django.contrib.contenttypes.models import ContentType
+from django.contrib import admin
+from django.contrib.admin.util import quote
+from django.core.urlresolvers import reverse, NoReverseMatch
 
 
 register = template.Library()
 
+PK_PLACEHOLDER = '__pk__'
+
+_change_urls = None
+
+
+def change_urls():
+    """
+    Model -> (prefix, suffix) of its admin change url, for every model
+    registered in the admin site. Urls are reversed once, on first use,
+    and joined with the quoted pk of an object later.
+    """
+    global _change_urls
+    if _change_urls is None:
+        urls = {}
+        for model in admin.site._registry:
+            opts = model._meta
+            try:
+                url = reverse('admin:%s_%s_change' %
+                              (opts.app_label, opts.model_name),
+                              args=(PK_PLACEHOLDER,),
+                              current_app=admin.site.name)
+            except NoReverseMatch:
+                continue
+            urls[model] = tuple(url.split(PK_PLACEHOLDER, 1))
+        _change_urls = urls
+    return _change_urls
+
+
+def admin_change_url(obj):
+    """Admin change url of ``obj``, None if its model isn't registered."""
+    urls = change_urls()
+    url = urls.get(obj.__class__) or urls.get(obj._meta.concrete_model)
+    if url is None or obj.pk is None:
+        return None
+    return '%s%s%s' % (url[0], quote(obj.pk), url[1])
+
 
 @register.inclusion_tag('templatetags/edit_link.html')
 def edit_link(obj):
     if isinstance(obj, models.Model):
-        model = ContentType.objects.get_for_model(obj)
-        edit_link = '/admin/%s/%s/%d' %\
-                    (model.app_label, model.model, int(obj.id))
         return {
-            'edit_link': edit_link,
+            'edit_link': admin_change_url(obj),
         }
 
     return None
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from django import template
+
+
+register = template.Library()
+
+
+@register.inclusion_tag('templatetags/responsive_image.html')
+def responsive_image(person, sizes='200px', alt=''):
+    """
+    <picture> of the person photo with a srcset per thumbnail format,
+    so the browser fetches only the size and format it needs.
+    """
+    context = {'sizes': sizes, 'alt': alt}
+    if person is None or not person.image:
+        return context
+
+    thumbnails = person.thumbnail_set()
+    if not thumbnails:
+        # not processed yet
+        context['src'] = person.image.url
+        return context
+
+    storage = person.thumbnail.storage
+    sources = []
+    for thumbnail in thumbnails:
+        srcset = '%s %dw' % (storage.url(thumbnail['name']),
+                             thumbnail['width'])
+        for source in sources:
+            if source['type'] == thumbnail['type']:
+                # boxes bigger than the photo give the same width
+                if thumbnail['width'] not in source['widths']:
+                    source['widths'].add(thumbnail['width'])
+                    source['srcset'].append(srcset)
+                break
+        else:
+            sources.append({'type': thumbnail['type'],
+                            'widths': set([thumbnail['width']]),
+                            'srcset': [srcset]})
+    for source in sources:
+        source['srcset'] = ', '.join(source['srcset'])
+
+    context.update(src=person.thumbnail.url,
+                   width=person.width,
+                   height=person.height,
+                   srcset=[s['srcset'] for s in sources
+                           if s['type'] == 'image/jpeg'][0],
+                   sources=[s for s in sources if s['type'] != 'image/jpeg'])
+    return context
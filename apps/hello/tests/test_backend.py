@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test import SimpleTestCase
+from django.db.utils import ConnectionHandler
+
+import os
+import shutil
+import tempfile
+import threading
+
+
+class SQLiteTuningTest(SimpleTestCase):
+    WRITERS = 8
+    WRITES = 40
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.connections = ConnectionHandler({
+            'default': {
+                'ENGINE': 'apps.backends.sqlite3',
+                'NAME': os.path.join(self.directory, 'test.sqlite3'),
+                'PRAGMAS': {'cache_size': -4000, 'mmap_size': None},
+            },
+        })
+        cursor = self.connections['default'].cursor()
+        cursor.execute('CREATE TABLE counter (id INTEGER PRIMARY KEY, '
+                       'writer INTEGER, n INTEGER)')
+
+    def tearDown(self):
+        self.connections['default'].close()
+        shutil.rmtree(self.directory)
+
+    def pragma(self, name):
+        cursor = self.connections['default'].cursor()
+        cursor.execute('PRAGMA %s' % name)
+        return cursor.fetchone()
+
+    def test_pragmas(self):
+        """Test check that pragmas from settings are set on connection."""
+        self.assertEqual(self.pragma('journal_mode'), ('wal',))
+        # NORMAL
+        self.assertEqual(self.pragma('synchronous'), (1,))
+        self.assertEqual(self.pragma('busy_timeout'), (5000,))
+        self.assertEqual(self.pragma('cache_size'), (-4000,))
+        self.assertEqual(self.pragma('mmap_size'), (0,))
+
+    def test_parallel_writers(self):
+        """
+        Test check that writers in parallel threads, which read before
+        they write in a transaction, all succeed.
+        """
+        errors = []
+
+        def write(writer):
+            connection = self.connections['default']
+            try:
+                cursor = connection.cursor()
+                for i in range(self.WRITES):
+                    # what atomic() does on sqlite
+                    connection._start_transaction_under_autocommit()
+                    cursor.execute('SELECT COUNT(*) FROM counter '
+                                   'WHERE writer = %s', [writer])
+                    n = cursor.fetchone()[0]
+                    cursor.execute('INSERT INTO counter (writer, n) '
+                                   'VALUES (%s, %s)', [writer, n])
+                    cursor.execute('COMMIT')
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=write, args=(i,))
+                   for i in range(self.WRITERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        cursor = self.connections['default'].cursor()
+        cursor.execute('SELECT COUNT(*), COUNT(DISTINCT writer || "-" || n) '
+                       'FROM counter')
+        self.assertEqual(cursor.fetchone(),
+                         (self.WRITERS * self.WRITES,) * 2)
@@ -4,12 +4,18 @@ from django.test import TestCase
 from django.core.management import call_command
 from django.utils.six import StringIO
 
-from datetime import date
+from django.db.models import Sum
+from django.utils import timezone
 
-from ..models import Person
+from datetime import date, timedelta
+
+from ..models import Person, NoteModel, RequestPath, RequestStore
+from ..models import RequestCounter
 
 
 class CommandsTestCase(TestCase):
+    multi_db = True
+
     def test_showmodels(self):
         """ Test showmodels command."""
         out = StringIO()
@@ -27,3 +33,34 @@ class CommandsTestCase(TestCase):
         # number of objects model Person is 1, after person is created
         call_command('showmodels', stdout=out, stderr=out)
         self.assertIn('Person - 1', out.getvalue())
+
+    def test_prune_requests(self):
+        """Test prune_requests command."""
+        request_path = RequestPath.objects.create(path='/')
+        now = timezone.now()
+        requests = [RequestStore(path='/', request_path=request_path,
+                                 method='GET', date=now - timedelta(days=d))
+                    for d in (40, 35, 31, 10, 0)]
+        RequestStore.objects.log(requests)
+        notes = NoteModel.objects.count()
+
+        out = StringIO()
+        call_command('prune_requests', days=30, chunk_size=2, stdout=out)
+        self.assertIn('Deleted 3 requests', out.getvalue())
+        self.assertIn('rows/s', out.getvalue())
+
+        # only requests of last 30 days are left
+        self.assertEqual(RequestStore.objects.count(), 2)
+        self.assertFalse(RequestStore.objects.filter(
+            date__lt=now - timedelta(days=30)).exists())
+
+        # rollups still count deleted requests, deletions aren't audited
+        self.assertEqual(RequestPath.objects.get().hits, 5)
+        self.assertEqual(RequestCounter.objects.aggregate(
+            hits=Sum('hits'))['hits'], 5)
+        self.assertEqual(NoteModel.objects.count(), notes)
+
+        # nothing else to delete
+        out = StringIO()
+        call_command('prune_requests', days=30, stdout=out)
+        self.assertIn('Deleted 0 requests', out.getvalue())
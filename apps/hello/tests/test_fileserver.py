@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test import SimpleTestCase
+from django.utils.http import http_date
+
+from wsgiref.util import setup_testing_defaults
+import os
+import shutil
+import tempfile
+
+from fortytwo_test_task.fileserver import FileServer
+
+
+class FileServerTest(SimpleTestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, 'js'))
+        for name, content in (('js/app.js', b'var a = 1;'),
+                              ('js/app.0123456789ab.js', b'var a = 1;'),
+                              ('js/app.0123456789ab.js.gz', b'gzipped')):
+            with open(os.path.join(self.root, name), 'wb') as f:
+                f.write(content)
+        self.app_calls = []
+        self.server = FileServer(self.app, [('/static/', self.root)])
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def app(self, environ, start_response):
+        self.app_calls.append(environ['PATH_INFO'])
+        start_response(b'404 Not Found', [])
+        return [b'django']
+
+    def get(self, path, **extra):
+        environ = {'PATH_INFO': path, 'REQUEST_METHOD': 'GET'}
+        environ.update(extra)
+        setup_testing_defaults(environ)
+        response = {}
+
+        def start_response(status, headers):
+            response['status'] = status
+            response['headers'] = dict(headers)
+
+        body = b''.join(self.server(environ, start_response))
+        return response['status'], response['headers'], body
+
+    def test_serve_file(self):
+        """Test check that files are served with headers for caching."""
+        status, headers, body = self.get('/static/js/app.js')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(body, b'var a = 1;')
+        self.assertEqual(headers['Content-Length'], '10')
+        self.assertIn('javascript', headers['Content-Type'])
+        self.assertEqual(headers['Cache-Control'], 'public, max-age=60')
+
+        status, headers, body = self.get(
+            '/static/js/app.js', HTTP_IF_MODIFIED_SINCE=http_date())
+        self.assertEqual(status, '304 Not Modified')
+        self.assertEqual(body, b'')
+        self.assertEqual(self.app_calls, [])
+
+    def test_serve_hashed_gzipped(self):
+        """
+        Test check that hashed files are cached for a year and gzipped
+        copy is sent to clients accepting it.
+        """
+        status, headers, body = self.get('/static/js/app.0123456789ab.js',
+                                         HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(body, b'gzipped')
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertIn('javascript', headers['Content-Type'])
+        self.assertEqual(headers['Cache-Control'],
+                         'public, max-age=31536000, immutable')
+
+        status, headers, body = self.get('/static/js/app.0123456789ab.js')
+        self.assertEqual(body, b'var a = 1;')
+        self.assertNotIn('Content-Encoding', headers)
+
+    def test_serve_thumbnail(self):
+        """Test check that content-addressed thumbnails are cached too."""
+        os.makedirs(os.path.join(self.root, 'photo', 'thumbnail'))
+        name = 'photo/thumbnail/%s-200.webp' % ('a' * 40)
+        with open(os.path.join(self.root, name), 'wb') as f:
+            f.write(b'webp')
+        self.server = FileServer(self.app, [('/uploads/', self.root)])
+        status, headers, body = self.get('/uploads/' + name)
+        self.assertEqual(body, b'webp')
+        self.assertEqual(headers['Cache-Control'],
+                         'public, max-age=31536000, immutable')
+
+    def test_pass_to_application(self):
+        """
+        Test check that other urls, missing files and paths out of the
+        directory go to the application.
+        """
+        self.get('/')
+        self.get('/static/js/missing.js')
+        self.get('/static/../' + os.path.basename(self.root) + '/js/app.js')
+        self.get('/static/%2e%2e/etc/passwd')
+        self.assertEqual(len(self.app_calls), 4)
@@ -8,6 +8,8 @@ from ..forms import PersonForm
 
 
 class FormTest(TestCase):
+    multi_db = True
+
     def test_form(self):
         """Test check form """
         form_data = {'name': '',
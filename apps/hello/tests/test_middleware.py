@@ -1,18 +1,23 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 from django.test.client import RequestFactory
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.core.urlresolvers import reverse
+from django.db import connections
+from django.test.utils import override_settings, CaptureQueriesContext
 
-from ..models import RequestStore
+from ..models import RequestPath, RequestStore
+from ..buffers import BulkBuffer
+from ..registry import PriorityRegistry, priority_registry
 from apps.middleware.helloRequest import RequestMiddle
 from ..decorators import not_record_request
 from ..views import home_page
 
 
 class RequestMiddlewareTests(TestCase):
+    multi_db = True
     fixtures = ['_initial_data.json']
 
     def setUp(self):
@@ -54,3 +59,167 @@ class RequestMiddlewareTests(TestCase):
         self.assertEquals(len(rs), 2)
         only_one_rs = rs[1]
         self.assertEqual(only_one_rs.path, reverse('contact:home'))
+
+
+class RequestTransactionTests(TransactionTestCase):
+    multi_db = True
+
+    def setUp(self):
+        priority_registry.clear()
+
+    def test_one_transaction(self):
+        """
+        Test check a logged request is written in one transaction of
+        the log database.
+        """
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        RequestMiddle().process_view(request, home_page)
+        with CaptureQueriesContext(connections['logs']) as queries:
+            RequestMiddle().process_view(request, home_page)
+        statements = [query['sql'] for query in queries]
+        # BEGIN IMMEDIATE, INSERT and UPDATE of path and hour counters
+        self.assertEqual(len([sql for sql in statements
+                              if 'BEGIN IMMEDIATE' in sql]), 1)
+        self.assertEqual(len(statements), 4)
+        self.assertEqual(RequestPath.objects.get().hits, 2)
+
+
+class RequestBufferTests(TestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = RequestMiddle()
+        # no background thread: it would write through its own connection
+        self.middleware.buffer = BulkBuffer(RequestStore.objects.log,
+                                            max_size=3,
+                                            batch_size=2,
+                                            flush_interval=None)
+
+    @override_settings(REQUEST_LOG_BUFFERED=True)
+    def test_buffered_middleware(self):
+        """Test check buffered mode queues requests and flushes them."""
+        buf = self.middleware.buffer
+        for i in range(4):
+            request = self.factory.get('/test%s' % i)
+            request.user = AnonymousUser()
+            self.middleware.process_view(request, home_page)
+
+        # nothing is written in the request, fourth record is dropped
+        self.assertEqual(RequestStore.objects.count(), 0)
+        self.assertEqual(buf.stats(), {'pending': 3, 'flushed': 0,
+                                       'dropped': 1, 'failed': 0})
+
+        # flush writes all queued records in batches
+        self.assertEqual(buf.flush(), 3)
+        self.assertEqual(buf.stats(), {'pending': 0, 'flushed': 3,
+                                       'dropped': 1, 'failed': 0})
+        paths = RequestStore.objects.values_list('request_path__path',
+                                                 flat=True)
+        self.assertEqual(sorted(paths), ['/test0', '/test1', '/test2'])
+        self.assertEqual(RequestPath.objects.get(path='/test0').hits, 1)
+
+    def test_buffer_keeps_request_date(self):
+        """Test check record date is the request time, not flush time."""
+        buf = self.middleware.buffer
+        request = self.factory.get(reverse('contact:home'))
+        request.user = AnonymousUser()
+        with self.settings(REQUEST_LOG_BUFFERED=True):
+            self.middleware.process_view(request, home_page)
+        queued_date = buf._items[0].date
+        buf.drain()
+        self.assertEqual(RequestStore.objects.get().date, queued_date)
+
+    def test_buffer_counts_failed_writes(self):
+        """Test check failed batch is counted and doesn't stop flushing."""
+        def writer(batch):
+            raise ValueError('broken writer')
+
+        buf = BulkBuffer(writer, batch_size=1, flush_interval=None)
+        buf.put(RequestStore(path='/', method='GET'))
+        buf.put(RequestStore(path='/', method='GET'))
+        self.assertEqual(buf.flush(), 0)
+        self.assertEqual(buf.stats()['failed'], 2)
+        self.assertEqual(len(buf), 0)
+
+    def test_buffer_clear(self):
+        """Test check clear drops queued records without writing them."""
+        buf = self.middleware.buffer
+        buf.put(RequestStore(path='/', method='GET'))
+        buf.put(RequestStore(path='/', method='GET'))
+        self.assertEqual(buf.clear(), 2)
+        self.assertEqual(buf.flush(), 0)
+        self.assertEqual(RequestStore.objects.count(), 0)
+
+
+class PriorityRegistryTests(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = RequestMiddle()
+        priority_registry.clear()
+
+    def test_middleware_doesnt_read_path(self):
+        """Test check middleware finds RequestPath without db queries."""
+        request_path = RequestPath.objects.create(path='/', priority=3)
+
+        # the first request looks the path up
+        request = self.factory.get('/')
+        request.user = AnonymousUser()
+        self.middleware.process_view(request, home_page)
+        # INSERT of the new record (requests aren't audited),
+        # UPDATE of path and hourly hit counters, in a savepoint of the
+        # test's transaction
+        with self.assertNumQueries(5, using='logs'):
+            self.middleware.process_view(request, home_page)
+        self.assertEqual(RequestStore.objects.first().request_path,
+                         request_path)
+        self.assertEqual(RequestPath.objects.get().hits, 2)
+
+        # new path is created once
+        request = self.factory.get('/new/')
+        request.user = AnonymousUser()
+        self.middleware.process_view(request, home_page)
+        self.middleware.process_view(request, home_page)
+        self.assertEqual(RequestPath.objects.get(path='/new/').hits, 2)
+
+    def test_registry_version(self):
+        """Test check priority change is seen by other registries."""
+        RequestPath.objects.create(path='/')
+        worker1 = PriorityRegistry(ttl=60)
+        worker2 = PriorityRegistry(ttl=60)
+        self.assertEqual(worker1.get('/'), 0)
+        self.assertEqual(worker2.get('/'), 0)
+
+        worker1.set('/', 2)
+        self.assertEqual(RequestPath.objects.get().priority, 2)
+        # worker1 updates its copy in place, worker2 reloads
+        with self.assertNumQueries(0, using='logs'):
+            self.assertEqual(worker1.get('/'), 2)
+        with self.assertNumQueries(1, using='logs'):
+            self.assertEqual(worker2.get('/'), 2)
+
+    def test_registry_ttl(self):
+        """Test check registry reloads from db after ttl."""
+        registry = PriorityRegistry(ttl=0)
+        self.assertEqual(registry.get('/'), 0)
+        RequestPath.objects.bulk_create([RequestPath(path='/', priority=4)])
+        self.assertEqual(registry.get('/'), 4)
+
+    def test_registry_size(self):
+        """Test check registry keeps recently used paths only."""
+        registry = PriorityRegistry(ttl=60, size=2)
+        first = registry.path_id('/a/')
+        registry.path_id('/b/')
+        registry.get('/a/')
+        registry.path_id('/c/')
+        self.assertEqual(len(registry), 2)
+        with self.assertNumQueries(0, using='logs'):
+            self.assertEqual(registry.path_id('/a/'), first)
+        # /b/ was least recently used
+        with self.assertNumQueries(1, using='logs'):
+            registry.path_id('/b/')
+        self.assertEqual(RequestPath.objects.count(), 3)
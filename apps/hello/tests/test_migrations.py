@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test import SimpleTestCase
+from django.conf import settings
+
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+SETTINGS = """
+from fortytwo_test_task.settings import *
+DATABASES['default']['NAME'] = %r
+DATABASES['logs']['NAME'] = %r
+"""
+
+# requests as the last migration before RequestPath left them
+REQUESTS = [
+    (1, '/', 'GET', 3, 0),
+    (2, '/x/', 'GET', 5, 0),
+    (3, '/', 'POST', 3, 1),
+    (4, '/x/', 'GET', 5, 1),
+]
+
+
+class UpgradeTest(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.default = os.path.join(self.directory, 'db.sqlite3')
+        self.logs = os.path.join(self.directory, 'logs.sqlite3')
+        with open(os.path.join(self.directory,
+                               'upgrade_settings.py'), 'w') as f:
+            f.write(SETTINGS % (self.default, self.logs))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def manage(self, *args):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='upgrade_settings',
+                   PYTHONPATH=os.pathsep.join([self.directory,
+                                               settings.BASE_DIR]))
+        subprocess.check_output(
+            [sys.executable, os.path.join(settings.BASE_DIR, 'manage.py')] +
+            list(args), env=env, stderr=subprocess.STDOUT)
+
+    def query(self, path, sql):
+        connection = sqlite3.connect(path)
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def test_upgrade_populated(self):
+        """
+        Test check an install from before the log database keeps its
+        requests, priorities, seen requests and records on upgrade.
+        """
+        self.manage('syncdb', '--noinput')
+        self.manage('migrate', 'hello', '0008')
+        connection = sqlite3.connect(self.default)
+        with connection:
+            connection.executemany(
+                'INSERT INTO hello_requeststore (id, path, method, '
+                'priority, new_request, date) '
+                'VALUES (?, ?, ?, ?, ?, "2015-07-14 10:00:00")', REQUESTS)
+            connection.execute(
+                'INSERT INTO hello_notemodel (model, inst, action_type) '
+                'VALUES ("Person", "Ivan Ivanov", 1)')
+        connection.close()
+
+        self.manage('migrate')
+        self.manage('syncdb', '--noinput', '--database=logs')
+        self.manage('migrate', '--database=logs')
+
+        self.assertEqual(
+            self.query(self.logs, 'SELECT path, priority, hits '
+                                  'FROM hello_requestpath ORDER BY path'),
+            [('/', 3, 2), ('/x/', 5, 2)])
+        self.assertEqual(
+            self.query(self.logs, 'SELECT COUNT(*) FROM hello_requeststore '
+                                  'WHERE request_path_id IS NOT NULL'),
+            [(4,)])
+        self.assertEqual(
+            self.query(self.logs, 'SELECT SUM(hits) '
+                                  'FROM hello_requestcounter'),
+            [(4,)])
+        self.assertEqual(
+            self.query(self.logs, 'SELECT id, last_id '
+                                  'FROM hello_requestwatermark'),
+            [(1, 2)])
+        self.assertEqual(
+            self.query(self.logs, 'SELECT COUNT(*) FROM hello_notemodel '
+                                  'WHERE content_type_id IS NOT NULL'),
+            [(1,)])
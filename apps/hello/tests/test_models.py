@@ -1,16 +1,39 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
+from django.db import connection, connections, transaction, IntegrityError
+from django.db.models.query import QuerySet
+from django.conf import settings
+from django.core.cache import get_cache
+from django.utils.unittest import skipUnless
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
+from django.core.files import File
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.urlresolvers import reverse
+from django.contrib.auth.models import User
+from django.test.client import RequestFactory
+from django.test.utils import override_settings, CaptureQueriesContext
 
-from datetime import date
+from datetime import date, datetime
 from PIL import Image as Img
 import StringIO
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 
-from ..models import Person, NoteModel, RequestStore
+from django.utils import timezone
+
+from ..models import Person, NoteModel, RequestStore, person_cache_lookup
+from ..models import PersonManager
+from ..models import RequestPath, RequestCounter, RequestWatermark
+from ..registry import priority_registry
+from ..images import ImagePipeline, render_thumbnails, validate_image
+from ..audit import audit_sink, set_actor
+from ..buffers import BulkBuffer
 
 
 # create image file for test
@@ -31,6 +54,7 @@ def get_temporary_image():
 
 
 class PersonModelTests(TestCase):
+    multi_db = True
     fixtures = ['_initial_data.json']
 
     def test_person_model(self):
@@ -94,10 +118,36 @@ class PersonModelTests(TestCase):
         self.assertEquals(only_person.bio, 'I was born ...')
         self.assertEquals(str(only_person), 'Woronow Aleks')
 
+    def test_person_changed_fields(self):
+        """
+        Test check that person knows its changed fields without
+        queries and saves only them.
+        """
+        person = Person.objects.get(id=1)
+        self.assertEqual(person.changed_fields(), [])
+        with self.assertNumQueries(0):
+            person.save()
+
+        person.name = 'Ivan'
+        person.bio = 'Changed'
+        self.assertEqual(sorted(person.changed_fields()), ['bio', 'name'])
+        self.assertEqual(person.changed_values(),
+                         {'name': 'Ivan', 'bio': 'Changed'})
+        with CaptureQueriesContext(connection) as queries:
+            person.save()
+        self.assertEqual(len(queries), 1)
+        for column in ('"name"', '"bio"', '"modified"'):
+            self.assertIn(column, queries[0]['sql'])
+        self.assertNotIn('"surname"', queries[0]['sql'])
+
+        self.assertEqual(person.changed_fields(), [])
+        self.assertEqual(Person.objects.get(id=1).bio, 'Changed')
+
+    @override_settings(IMAGE_PIPELINE_WORKERS=0)
     def test_person_model_image(self):
         """
-        Test check that overwritten save method maintaining aspect ratio
-        and reduce image to <= 200*200.
+        Test check that thumbnail of the photo keeps aspect ratio
+        and is reduced to <= 200*200.
         """
 
         # save image file
@@ -106,15 +156,267 @@ class PersonModelTests(TestCase):
         person.save()
 
         # check that height and width <= 200
-        self.assertTrue(person.height <= 200)
-        self.assertTrue(person.width <= 200)
+        person = Person.objects.get(id=1)
+        self.assertTrue(person.image_ready)
+        self.assertEqual((person.width, person.height), (200, 116))
+        self.assertEqual([t['width'] for t in person.thumbnail_set()
+                          if t['type'] == 'image/jpeg'], [400, 200, 100])
+        self.assertEqual((person.image.width, person.image.height),
+                         (1200, 700))
+        self.assertIn(person.image_hash, person.thumbnail.name)
+
+        person.delete()
+
+    @override_settings(IMAGE_PIPELINE_WORKERS=0)
+    def test_person_model_image_unchanged(self):
+        """
+        Test check that photo isn't processed again when it is saved
+        with the same content or not changed.
+        """
+        person = Person.objects.get(id=1)
+        person.image = get_temporary_image()
+        person.save()
+        person = Person.objects.get(id=1)
+        image, thumbnail = person.image, person.thumbnail.name
+
+        person.name = 'Ivan'
+        person.save()
+        person.image = get_temporary_image()
+        person.save()
+
+        person = Person.objects.get(id=1)
+        self.assertTrue(person.image_ready)
+        self.assertEqual(person.thumbnail.name, thumbnail)
+
+        # same content isn't stored again
+        self.assertEqual(person.image.name, image.name)
+        person.delete()
+
+    @override_settings(IMAGE_PIPELINE_WORKERS=0)
+    def test_person_model_image_retried(self):
+        """
+        Test check that photo without thumbnails is processed again
+        when the same content is uploaded.
+        """
+        person = Person.objects.get(id=1)
+        person.image = get_temporary_image()
+        person.save()
+        # the job of the first upload was lost
+        Person.objects.filter(id=1).update(image_ready=False, thumbnail='',
+                                           thumbnails='')
+
+        person = Person.objects.get(id=1)
+        person.image = get_temporary_image()
+        person.save()
 
+        person = Person.objects.get(id=1)
+        self.assertTrue(person.image_ready)
+        self.assertIn(person.image_hash, person.thumbnail.name)
         person.delete()
 
 
-class NoteModelTestCase(TestCase):
+def memory_status(key):
+    """VmRSS / VmHWM of this process in bytes."""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(key + ':'):
+                return int(line.split()[1]) * 1024
+
+
+class PersonManagerTestCase(TestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+
+    def setUp(self):
+        Person.objects.changed()
+        self.lookups = []
+        person_cache_lookup.connect(self.lookup)
+
+    def tearDown(self):
+        person_cache_lookup.disconnect(self.lookup)
+
+    def lookup(self, sender, hit, **kwargs):
+        self.lookups.append(hit)
+
+    def test_primary(self):
+        """Test check that primary person is read once and then copied."""
+        first = Person.objects.first()
+        with self.assertNumQueries(1):
+            person = Person.objects.primary()
+        with self.assertNumQueries(0):
+            other = Person.objects.primary()
+        self.assertEqual(person, first)
+        self.assertEqual(other.name, first.name)
+        self.assertEqual(other.image.name, first.image.name)
+        self.assertIsNot(person, other)
+        self.assertFalse(other._state.adding)
+        self.assertEqual(other.changed_fields(), [])
+        self.assertEqual(self.lookups, [False, True])
+
+    def test_primary_changed(self):
+        """Test check that saved person is read again."""
+        person = Person.objects.primary()
+        person.name = 'Changed'
+        # an instance handed out doesn't change the cached one
+        self.assertNotEqual(Person.objects.primary().name, 'Changed')
+        person.save()
+        self.assertEqual(Person.objects.primary().name, 'Changed')
+        self.assertEqual(self.lookups, [False, True, False])
+
+        Person.objects.all().delete()
+        self.assertIsNone(Person.objects.primary())
+
+    def test_primary_shared_cache(self):
+        """
+        Test check that person version is kept in the cache of the home
+        page card, so workers sharing that cache see a save at once.
+        """
+        files = get_cache('files')
+        with override_settings(HOME_PAGE_CACHE=dict(
+                settings.HOME_PAGE_CACHE, ALIAS='files')):
+            # the copy of another worker
+            worker = PersonManager()
+            worker.model = Person
+            self.assertEqual(worker.primary().name,
+                             Person.objects.first().name)
+
+            Person.objects.update(name='Changed')
+            Person.objects.changed()
+            self.assertIsNotNone(files.get(PersonManager.version_key))
+            self.assertEqual(worker.primary().name, 'Changed')
+        files.delete(PersonManager.version_key)
+
+    def test_primary_ttl(self):
+        """Test check that primary person is read again after ttl."""
+        Person.objects.primary()
+        stats = Person.objects.stats()
+        with override_settings(PERSON_CACHE_TTL=-1):
+            with self.assertNumQueries(1):
+                Person.objects.primary()
+        self.assertEqual(Person.objects.stats()['misses'],
+                         stats['misses'] + 1)
+
+
+class ImagePipelineTestCase(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        # 24 megapixels, 72 MB once decoded; it is made by another
+        # process, so that memory isn't left reusable in this one
+        fd, self.large_image = tempfile.mkstemp(suffix='.jpg')
+        os.close(fd)
+        subprocess.check_call([
+            sys.executable, '-c',
+            'from PIL import Image; '
+            'Image.new("RGB", (6000, 4000), (255, 0, 0))'
+            '.save("%s", format="JPEG")' % self.large_image])
+
+    def tearDown(self):
+        os.remove(self.large_image)
+
+    @skipUnless(os.path.exists('/proc/self/clear_refs'),
+                'peak RSS can be reset on Linux only')
+    def test_thumbnails_memory(self):
+        """
+        Test check that thumbnails of a large JPEG are built without
+        decoding all of its pixels.
+        """
+        # reset peak RSS of the process
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        rss = memory_status('VmRSS')
+
+        with open(self.large_image, 'rb') as image:
+            sizes = [(size, fmt[0], dimensions) for size, fmt, dimensions, c
+                     in render_thumbnails(File(image))]
+
+        self.assertIn((400, 'JPEG', (400, 266)), sizes)
+        self.assertLess(memory_status('VmHWM') - rss, 16 * 1024 * 1024)
+
+    def test_validate_image(self):
+        """Test check photos over memory ceiling are rejected."""
+        with open(self.large_image, 'rb') as image:
+            validate_image(File(image))
+            with override_settings(IMAGE_MAX_DECODE_SIZE=1024 * 1024):
+                with self.assertRaises(ValidationError):
+                    validate_image(File(image))
+
+
+class ImagePipelineWorkersTestCase(TransactionTestCase):
+    # jobs of workers are queued once transactions commit
+    multi_db = True
+
+    def test_pipeline_workers(self):
+        """
+        Test check photos are processed by worker threads and
+        inline when there are no workers.
+        """
+        done = threading.Event()
+        calls = []
+
+        def task(person_id, image_hash):
+            calls.append((person_id, image_hash,
+                          threading.current_thread().name))
+            done.set()
+
+        pipeline = ImagePipeline(task)
+        with override_settings(IMAGE_PIPELINE_WORKERS=1):
+            pipeline.submit(1, 'a' * 40)
+            self.assertTrue(done.wait(5))
+        self.assertEqual(calls[0][:2], (1, 'a' * 40))
+        self.assertNotEqual(calls[0][2], threading.current_thread().name)
+
+        with override_settings(IMAGE_PIPELINE_WORKERS=0):
+            pipeline.submit(2, 'b' * 40)
+        self.assertEqual(calls[1],
+                         (2, 'b' * 40, threading.current_thread().name))
+
+    def test_pipeline_after_commit(self):
+        """
+        Test check photos saved in a transaction are processed once it
+        commits and not at all when it is rolled back.
+        """
+        done = threading.Event()
+        calls = []
+
+        def task(person_id, image_hash):
+            calls.append(person_id)
+            done.set()
+
+        pipeline = ImagePipeline(task)
+        with override_settings(IMAGE_PIPELINE_WORKERS=1):
+            try:
+                with transaction.atomic():
+                    pipeline.submit(1, 'a' * 40)
+                    raise IntegrityError
+            except IntegrityError:
+                pass
+            with transaction.atomic():
+                pipeline.submit(2, 'b' * 40)
+                self.assertFalse(done.wait(0.1))
+            self.assertTrue(done.wait(5))
+        self.assertEqual(calls, [2])
+
+
+class NoteModelTestCase(TransactionTestCase):
+    multi_db = True
+    # NoteModel records are written once transactions commit
     fixtures = ['test_data.json']
 
+    @classmethod
+    def setUpClass(cls):
+        # flushed by tests, fixtures are loaded before setUp
+        cls.buffer = audit_sink.buffer
+        audit_sink.buffer = BulkBuffer(NoteModel.objects.bulk_create,
+                                       flush_interval=None)
+
+    @classmethod
+    def tearDownClass(cls):
+        audit_sink.buffer = cls.buffer
+
+    def setUp(self):
+        audit_sink.flush()
+
     def test_signal_processor(self):
         """
         Test signal processor records create,
@@ -128,17 +430,112 @@ class NoteModelTestCase(TestCase):
         person = Person.objects.first()
         person.name = 'Change'
         person.save()
+        audit_sink.flush()
         note = NoteModel.objects.filter(model='Person').last()
         self.assertEqual(note.action_type, 1)
 
         # check record after delete object is 2
         person = Person.objects.first()
         person.delete()
+        audit_sink.flush()
         note = NoteModel.objects.last()
         self.assertEqual(note.action_type, 2)
 
+    def test_rolled_back_changes(self):
+        """
+        Test check changes are recorded in one batch when transaction
+        commits, and not recorded when it is rolled back.
+        """
+        notes = NoteModel.objects.count()
+        with transaction.atomic(using='logs'), transaction.atomic():
+            Person.objects.create(name='A', surname='A', email='a@a.com',
+                                  date_of_birth=date(2000, 1, 1))
+            try:
+                with transaction.atomic(using='logs'):
+                    RequestPath.objects.create(path='/rolled/back/')
+                    raise IntegrityError
+            except IntegrityError:
+                pass
+            RequestPath.objects.create(path='/committed/')
+            self.assertEqual(len(audit_sink.buffer), 0)
+
+        self.assertEqual(len(audit_sink.buffer), 2)
+        with CaptureQueriesContext(connections['logs']) as queries:
+            audit_sink.flush()
+        inserts = [query for query in queries if 'INSERT' in query['sql']]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            list(NoteModel.objects.filter(id__gt=notes)
+                                  .values_list('model', 'inst')),
+            [('Person', 'A A'), ('RequestPath', '/committed/')])
+
+        try:
+            with transaction.atomic():
+                Person.objects.first().delete()
+                raise IntegrityError
+        except IntegrityError:
+            pass
+        self.assertEqual(len(audit_sink.buffer), 0)
+
+    def test_history(self):
+        """
+        Test check records keep object reference, time and actor and
+        history of an object or a model is returned oldest first.
+        """
+        user = User.objects.create_user('auditor', 'a@a.com', 'pass')
+        request = RequestFactory().get('/')
+        request.user = user
+        set_actor(request)
+        try:
+            person = Person.objects.create(name='A', surname='A',
+                                           email='a@a.com',
+                                           date_of_birth=date(2000, 1, 1))
+            person.name = 'B'
+            person.save()
+        finally:
+            set_actor(None)
+        other = Person.objects.exclude(pk=person.pk).first()
+        other.bio = 'Changed'
+        other.save()
+        audit_sink.flush()
+
+        history = list(NoteModel.objects.history(person))
+        self.assertEqual([(n.action_type, n.inst) for n in history],
+                         [(0, 'A A'), (1, 'A B')])
+        changes = json.loads(history[1].changes)
+        self.assertEqual(sorted(changes), ['modified', 'name'])
+        self.assertEqual(changes['name'], 'B')
+        self.assertEqual(set(n.actor for n in history), set([user]))
+        self.assertEqual(NoteModel.objects.history(other).last().actor, None)
+
+        since = history[1].timestamp
+        self.assertEqual(
+            list(NoteModel.objects.for_model(Person, since=since)
+                                  .values_list('object_id', flat=True)),
+            [person.pk, other.pk])
+        self.assertEqual(
+            NoteModel.objects.for_model(Person, until=since).count(), 2)
+
+    def test_excluded_and_sampled_models(self):
+        """Test check excluded models aren't recorded, sampled sometimes."""
+        RequestStore.objects.create(path='/', method='GET')
+        RequestCounter.objects.count_hits(RequestStore.objects.all())
+        self.assertEqual(len(audit_sink.buffer), 0)
+
+        with override_settings(AUDIT_LOG={'SAMPLE': {'RequestPath': 0}}):
+            RequestPath.objects.create(path='/sampled/')
+        self.assertEqual(len(audit_sink.buffer), 0)
+        with override_settings(AUDIT_LOG={'SAMPLE': {'RequestPath': 1}}):
+            RequestPath.objects.create(path='/recorded/')
+        self.assertEqual(len(audit_sink.buffer), 1)
+
 
 class RequestModelTestCase(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        priority_registry.clear()
+
     def test_record_priority_field(self):
         """
         Test record priority field.
@@ -152,15 +549,133 @@ class RequestModelTestCase(TestCase):
         # method - 'GET' and default priority - 0
         self.assertEqual(request_store.path, '/')
         self.assertEqual(request_store.method, 'GET')
-        self.assertEqual(request_store.priority, 0)
+        self.assertEqual(request_store.request_path.priority, 0)
 
         # change priority to 1 and send POST to home page
-        request_store.priority = 1
-        request_store.save()
+        request_path = request_store.request_path
+        request_path.priority = 1
+        request_path.save()
         self.client.post(reverse('contact:home'))
 
         # check record RequestStore contains:
         # method - 'POST' and default priority - 1
         request_store = RequestStore.objects.first()
         self.assertEqual(request_store.method, 'POST')
-        self.assertEqual(request_store.priority, 1)
+        self.assertEqual(request_store.request_path.priority, 1)
+
+
+class RequestCounterTestCase(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        self.home = RequestPath.objects.create(path='/')
+        self.other = RequestPath.objects.create(path='/other/')
+
+    def log(self, request_path, method, hour, minute):
+        date = datetime(2015, 8, 22, hour, minute, tzinfo=timezone.utc)
+        return RequestStore(path=request_path.path,
+                            request_path=request_path,
+                            method=method,
+                            date=date)
+
+    def test_counters_incremental(self):
+        """
+        Test check logged requests are counted per path, method and hour
+        and counters are added to by later batches.
+        """
+        RequestStore.objects.log([self.log(self.home, 'GET', 10, 1),
+                                  self.log(self.home, 'GET', 10, 59),
+                                  self.log(self.home, 'POST', 10, 5),
+                                  self.log(self.home, 'GET', 11, 0)])
+        RequestStore.objects.log([self.log(self.home, 'GET', 10, 30),
+                                  self.log(self.other, 'GET', 10, 30)])
+
+        counters = RequestCounter.objects.order_by('request_path', 'hour',
+                                                   'method')
+        self.assertEqual(
+            [(c.request_path.path, c.method, c.hour.hour, c.hits)
+             for c in counters],
+            [('/', 'GET', 10, 3), ('/', 'POST', 10, 1), ('/', 'GET', 11, 1),
+             ('/other/', 'GET', 10, 1)])
+
+        # path totals
+        self.assertEqual(RequestPath.objects.get(path='/').hits, 5)
+
+    def test_counters_query_api(self):
+        """Test check top paths and hits per hour queries."""
+        RequestStore.objects.log([self.log(self.home, 'GET', 10, 1),
+                                  self.log(self.home, 'POST', 10, 2),
+                                  self.log(self.home, 'GET', 12, 0),
+                                  self.log(self.other, 'GET', 12, 0),
+                                  self.log(self.other, 'GET', 12, 1),
+                                  self.log(self.other, 'GET', 12, 2),
+                                  self.log(self.other, 'GET', 12, 3)])
+
+        self.assertEqual(list(RequestCounter.objects.top_paths()),
+                         [('/other/', 4), ('/', 3)])
+        self.assertEqual(list(RequestCounter.objects.top_paths(limit=1)),
+                         [('/other/', 4)])
+
+        noon = datetime(2015, 8, 22, 12, tzinfo=timezone.utc)
+        self.assertEqual(list(RequestCounter.objects.top_paths(since=noon)),
+                         [('/other/', 4), ('/', 1)])
+        self.assertEqual(
+            [(hour.hour, hits) for hour, hits in
+             RequestCounter.objects.hits_per_hour('/')],
+            [(10, 2), (12, 1)])
+        self.assertEqual(
+            list(RequestCounter.objects.hits_per_hour('/', until=noon)),
+            [(datetime(2015, 8, 22, 10, tzinfo=timezone.utc), 2)])
+
+
+class RequestWatermarkTestCase(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        for i in range(3):
+            RequestStore.objects.create(path='/', method='GET')
+
+    def test_unseen_requests(self):
+        """
+        Test check requests after the watermark are unseen and marking
+        them seen is a single row write.
+        """
+        self.assertEqual(RequestWatermark.objects.unseen(), 3)
+
+        last_id = RequestStore.objects.last_id()
+        RequestWatermark.objects.mark_seen(last_id)
+        self.assertEqual(RequestWatermark.objects.unseen(), 0)
+
+        RequestStore.objects.create(path='/', method='GET')
+        self.assertEqual(RequestWatermark.objects.unseen(), 1)
+
+        with self.assertNumQueries(1, using='logs'):
+            RequestWatermark.objects.mark_seen(last_id + 1)
+        self.assertEqual(RequestWatermark.objects.count(), 1)
+
+        with self.assertNumQueries(1, using='logs'):
+            self.assertEqual(RequestWatermark.objects.last_seen(),
+                             last_id + 1)
+        # marked seen by another worker
+        RequestWatermark.objects.update(last_id=last_id + 2)
+        self.assertEqual(RequestWatermark.objects.last_seen(), last_id + 2)
+
+    def test_mark_seen_concurrently(self):
+        """
+        Test check first views of two workers at once both mark
+        requests seen.
+        """
+        update = QuerySet.update
+
+        def update_meanwhile(queryset, **kwargs):
+            # the other worker creates the row after this one found none
+            QuerySet.update = update
+            RequestWatermark.objects.create(pk=1, last_id=1)
+            return 0
+
+        QuerySet.update = update_meanwhile
+        try:
+            RequestWatermark.objects.mark_seen(2)
+        finally:
+            QuerySet.update = update
+        self.assertEqual(RequestWatermark.objects.last_seen(), 2)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test import TestCase
+from django.db import connections
+from django.db.backends.util import CursorWrapper
+from django.core.urlresolvers import reverse
+from django.utils import timezone
+
+import re
+
+from ..models import Person, NoteModel, RequestStore
+from ..registry import PriorityRegistry, priority_registry
+
+
+# tables that grow with traffic and must never be scanned
+LOG_TABLES = ('hello_requeststore', 'hello_requestpath',
+              'hello_requestcounter', 'hello_notemodel')
+
+# "SCAN TABLE t" before SQLite 3.36, "SCAN t" since
+PLAN_STEP = re.compile(r'^(SCAN|SEARCH) (?:TABLE )?(\w+)')
+
+
+class QueryRecorder(object):
+    """
+    Record database alias, sql and params of all queries executed in
+    the block.
+    """
+
+    def __enter__(self):
+        self.queries = []
+        self._execute = CursorWrapper.execute
+
+        def execute(cursor, sql, params=None):
+            self.queries.append((cursor.db.alias, sql, params))
+            return self._execute(cursor, sql, params)
+
+        CursorWrapper.execute = execute
+        return self
+
+    def __exit__(self, *exc_info):
+        CursorWrapper.execute = self._execute
+
+
+class QueryPlanTest(TestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+
+    def setUp(self):
+        priority_registry.clear()
+        for i in range(20):
+            self.client.get(reverse('contact:home'))
+
+    def query_plan(self, using, sql, params):
+        cursor = connections[using].cursor()
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return [row[-1] for row in cursor.fetchall()]
+
+    def is_limited_walk(self, sql, table, plan):
+        # 'SCAN table' in the order of "ORDER BY ... LIMIT n", along the
+        # rowid or an index, reads n rows only; unless it is sorted
+        return 'ORDER BY "%s".' % table in sql and ' LIMIT ' in sql and \
+            not any('TEMP B-TREE' in detail for detail in plan)
+
+    def assertNoFullScan(self, queries):
+        checked = 0
+        for using, sql, params in queries:
+            if not sql.startswith(('SELECT', 'UPDATE', 'DELETE')):
+                continue
+            plan = self.query_plan(using, sql, params)
+            for detail in plan:
+                match = PLAN_STEP.match(detail)
+                if match is None or match.group(2) not in LOG_TABLES:
+                    continue
+                checked += 1
+                step, table = match.groups()
+                if step == 'SEARCH' or \
+                        self.is_limited_walk(sql, table, plan):
+                    continue
+                # a scan of a covering index reads all of it too
+                self.fail('%s\n%s' % (sql, detail))
+        self.assertGreater(checked, 0)
+
+    def test_middleware_queries(self):
+        """Test check queries of RequestMiddle use indexes."""
+        with QueryRecorder() as recorder:
+            self.client.get(reverse('contact:home'))
+        self.assertNoFullScan(recorder.queries)
+
+    def test_registry_queries(self):
+        """
+        Test check paths the registry reads again, once stale or changed
+        by another registry, are looked up by index.
+        """
+        registry = PriorityRegistry(ttl=0)
+        other = PriorityRegistry(ttl=60)
+        with QueryRecorder() as recorder:
+            registry.path_id('/')
+            registry.get('/')
+            registry.path_id('/new/')
+            other.get('/')
+            registry.set('/', 2)
+            self.assertEqual(other.get('/'), 2)
+        self.assertNoFullScan(recorder.queries)
+
+    def test_request_views_queries(self):
+        """Test check queries of request views use indexes."""
+        last_id = RequestStore.objects.order_by('-id')[0].id
+        with QueryRecorder() as recorder:
+            self.client.get(reverse('contact:request_ajax'),
+                            HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+            self.client.post(reverse('contact:request_ajax'),
+                             {'path': '/', 'priority': '1'},
+                             HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+            self.client.get(reverse('contact:request_api'))
+            self.client.get(reverse('contact:request_api'),
+                            {'since_id': last_id - 5})
+            self.client.get(reverse('contact:request_poll'),
+                            {'since_id': last_id - 5})
+            self.client.get(reverse('contact:request'))
+        self.assertNoFullScan(recorder.queries)
+
+    def test_audit_history_queries(self):
+        """Test check history queries of NoteModel use indexes."""
+        person = Person.objects.first()
+        with QueryRecorder() as recorder:
+            list(NoteModel.objects.history(person))
+            list(NoteModel.objects.history(person, since=timezone.now()))
+            list(NoteModel.objects.for_model(Person, since=timezone.now(),
+                                             until=timezone.now()))
+        self.assertNoFullScan(recorder.queries)
+        for using, sql, params in recorder.queries:
+            for detail in self.query_plan(using, sql, params):
+                self.assertNotIn('TEMP B-TREE', detail)
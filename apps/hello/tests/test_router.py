@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test import TransactionTestCase
+from django.db import connections, router
+from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse
+
+from ..models import Person, NoteModel, RequestStore, RequestPath
+from ..audit import audit_sink
+
+
+class LogRouterTest(TransactionTestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+
+    def tearDown(self):
+        # records of committed changes, not flushed by this test
+        audit_sink.buffer.clear()
+
+    def test_log_database(self):
+        """
+        Test check logs are read and written in a database of their own
+        and other models in the default one.
+        """
+        for model in (RequestStore, RequestPath, NoteModel):
+            self.assertEqual(router.db_for_write(model), 'logs')
+        for model in (Person, User):
+            self.assertEqual(router.db_for_read(model), 'default')
+
+        default = connections['default'].introspection.table_names()
+        logs = connections['logs'].introspection.table_names()
+        self.assertIn('hello_person', default)
+        self.assertNotIn('hello_person', logs)
+        self.assertIn('hello_requeststore', logs)
+        self.assertNotIn('hello_requeststore', default)
+
+        self.client.login(username='admin', password='admin')
+        self.client.get(reverse('contact:home'))
+        request = RequestStore.objects.get()
+        self.assertEqual(request._state.db, 'logs')
+        self.assertEqual(request.user, User.objects.get(username='admin'))
+
+    def test_user_deleted(self):
+        """
+        Test check requests of a deleted user are deleted and records
+        made by the user lose their actor.
+        """
+        user = User.objects.get(username='admin')
+        RequestStore.objects.create(path='/', method='GET', user=user)
+        RequestStore.objects.create(path='/', method='GET')
+        person = Person.objects.get()
+        audit_sink.record(Person, person, 1, 'default')
+        audit_sink.flush()
+        NoteModel.objects.update(actor=user)
+
+        user_id = user.pk
+        user.delete()
+        self.assertEqual(RequestStore.objects.filter(user=user_id).count(), 0)
+        self.assertEqual(RequestStore.objects.count(), 1)
+        self.assertFalse(NoteModel.objects.filter(actor__isnull=False)
+                                          .exists())
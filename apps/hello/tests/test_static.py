@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.contrib.staticfiles import storage
+from django.template import Context, Template
+from django.test.utils import override_settings
+from django.utils.functional import empty
+
+import gzip
+import json
+import os
+import re
+import shutil
+import StringIO
+import tempfile
+
+from ..staticfiles import minify_css, minify_js, rebase_css_urls
+
+
+class StaticBundlesTest(TestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+    TEMPLATE = Template("{% load bundles %}{% bundle 'js/request.js' %}")
+
+    def setUp(self):
+        self.static_root = tempfile.mkdtemp()
+        self.settings = override_settings(STATIC_ROOT=self.static_root)
+        self.settings.enable()
+        storage.staticfiles_storage._wrapped = empty
+
+    def tearDown(self):
+        self.settings.disable()
+        storage.staticfiles_storage._wrapped = empty
+        shutil.rmtree(self.static_root)
+
+    def collect(self):
+        call_command('collectstatic', interactive=False, verbosity=0)
+        storage.staticfiles_storage._wrapped = empty
+        with open(os.path.join(self.static_root, 'staticfiles.json')) as f:
+            return json.load(f)
+
+    def read(self, name):
+        with open(os.path.join(self.static_root, name), 'rb') as f:
+            return f.read()
+
+    def test_collectstatic_bundles(self):
+        """
+        Test check that collectstatic builds hashed, minified bundles
+        with gzipped copies and a manifest of them.
+        """
+        manifest = self.collect()
+        hashed = manifest['js/request.js']
+        self.assertRegexpMatches(hashed, r'^js/request\.[0-9a-f]{12}\.js$')
+        content = self.read(hashed)
+        self.assertIn(b'var helloRequest', content)
+        self.assertIn(b'function setPriority', content)
+        self.assertIn(b'function csrfSafeMethod', content)
+        self.assertIn(b'\nvar rows = [];\n', content)
+        self.assertLess(len(content),
+                        len(self.read('js/req_ajax.js')) +
+                        len(self.read('js/req_ajax_priority.js')))
+
+        gzipped = gzip.GzipFile(
+            fileobj=StringIO.StringIO(self.read(hashed + '.gz')))
+        self.assertEqual(gzipped.read(), content)
+
+        # fonts of bootstrap are found from the bundle in other dir
+        css = self.read(manifest['css/base.css']).decode('utf-8')
+        font = manifest['bootstrap-3.3.5-dist/fonts/'
+                        'glyphicons-halflings-regular.woff']
+        self.assertIn('url("../%s")' % font, css)
+
+    def test_bundle_tag(self):
+        """
+        Test check that bundle tag links hashed bundle once it is
+        collected and files of the bundle before that or with DEBUG.
+        """
+        html = self.TEMPLATE.render(Context())
+        self.assertIn('<script src="/static/js/req_ajax.js"></script>', html)
+        self.assertIn('<script src="/static/js/req_ajax_priority.js">', html)
+
+        manifest = self.collect()
+        html = self.TEMPLATE.render(Context())
+        self.assertEqual(html, '<script src="/static/%s"></script>' %
+                         manifest['js/request.js'])
+
+        with override_settings(DEBUG=True):
+            html = self.TEMPLATE.render(Context())
+        self.assertIn('/static/js/req_ajax.js', html)
+
+    def test_form_page_assets(self):
+        """
+        Test check that form page links local files only, one bundled
+        script and stylesheet of its own along with the base ones.
+        """
+        self.client.login(username='admin', password='admin')
+        response = self.client.get(reverse('contact:form'))
+        self.assertContains(response, '/static/jquery-ui-1.13.2/ui/'
+                                      'widgets/datepicker.min.js')
+        self.assertContains(response, '/static/jquery-validation-1.19.3/'
+                                      'jquery.validate.min.js')
+        self.assertContains(response, '/static/js/change_contact.js')
+
+        manifest = self.collect()
+        content = self.client.get(reverse('contact:form')).content
+        self.assertNotRegexpMatches(content, r'(src|href)="(https?:)?//')
+        self.assertEqual(re.findall(r'<script src="/static/([^"]+)"',
+                                    content),
+                         [manifest['js/base.js'], manifest['js/form.js']])
+        self.assertEqual(re.findall(r'<link rel="stylesheet" '
+                                    r'href="/static/([^"]+)"', content),
+                         [manifest['css/base.css'], manifest['css/form.css']])
+
+        form_js = self.read(manifest['js/form.js'])
+        self.assertIn(b'datepicker', form_js)
+        self.assertIn(b'#person-form', form_js)
+        # client side rules, the server does not limit names to 16
+        self.assertIn(b'jQuery Validation Plugin', form_js)
+        self.assertIn(b'maxlength: 16', form_js)
+        self.assertIn(b'jQuery v1.11.3',
+                      self.read(manifest['js/base.js']))
+        form_css = self.read(manifest['css/form.css']).decode('utf-8')
+        self.assertIn('url("../%s")' % manifest[
+            'jquery-ui-1.13.2/themes/base/images/'
+            'ui-icons_444444_256x240.png'], form_css)
+
+    def test_home_page_etag_build(self):
+        """
+        Test check that home page isn't answered with 304 after a deploy,
+        which may change the page and the static files it links.
+        """
+        self.collect()
+        etag = self.client.get(reverse('contact:home'))['ETag']
+        response = self.client.get(reverse('contact:home'),
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # next deploy, in new processes
+        manifest = os.path.join(self.static_root, 'staticfiles.json')
+        built = os.path.getmtime(manifest) + 60
+        os.utime(manifest, (built, built))
+        storage.staticfiles_storage._wrapped = empty
+        response = self.client.get(reverse('contact:home'),
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_minify(self):
+        """Test check that minifiers keep what the code means."""
+        self.assertEqual(minify_css('/* a */\na:hover ,\nb {\n'
+                                    '  color: red;\n  border: 0;\n}\n'
+                                    '/*! license */'),
+                         'a:hover,b{color:red;border:0}/*! license */')
+        self.assertEqual(minify_js('// comment\nvar a = 1;\n\n'
+                                   '    var s = "a\\\n    b";\n'),
+                         'var a = 1;\nvar s = "a\\\n    b";')
+        self.assertEqual(rebase_css_urls('url("../fonts/f.eot?#iefix") '
+                                         'url(data:x) url(img/a.png)',
+                                         'lib/css/lib.css', 'css/all.css'),
+                         'url("../lib/fonts/f.eot?#iefix") url(data:x) '
+                         'url(../lib/css/img/a.png)')
@@ -1,19 +1,31 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 from django.test.client import RequestFactory
 from django.core.urlresolvers import reverse
 from django.http import HttpRequest
-from django.contrib.auth.models import AnonymousUser
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.contenttypes.models import ContentType
 from django.template import Context, Template
+from django.test.utils import override_settings
 
-from ..models import Person, RequestStore
+from PIL import Image as Img
+import StringIO
+import json
+import os
+import time
+
+from ..models import Person, RequestPath, RequestStore
 from ..views import home_page
-from ..templatetags.edit_link import edit_link
+from ..registry import priority_registry
+from ..pagecache import FragmentCache, home_card_cache
+from ..audit import audit_sink
+from ..templatetags.edit_link import edit_link, admin_change_url
 from test_models import get_temporary_image
 
 
 class HomePageViewTest(TestCase):
+    multi_db = True
     fixtures = ['_initial_data.json']
 
     def setUp(self):
@@ -106,8 +118,122 @@ class HomePageViewTest(TestCase):
         self.assertNotContains(response, 'iv@i.ua')
         self.assertNotContains(response, 'iv@khavr.com')
 
+    def test_home_page_conditional_get(self):
+        """
+        Test check that home page answers 304 while person and user
+        are the same and full page after person is changed.
+        """
+        response = self.client.get(reverse('contact:home'))
+        etag = response['ETag']
+
+        response = self.client.get(reverse('contact:home'),
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        # other user sees other links in the page
+        self.client.login(username='admin', password='admin')
+        response = self.client.get(reverse('contact:home'),
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        self.person.name = 'Changed'
+        self.person.save()
+        response = self.client.get(reverse('contact:home'),
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Changed')
+
+
+class HomePageCacheTest(TestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+
+    def setUp(self):
+        home_card_cache.forget()
+        self.factory = RequestFactory()
+        self.person = Person.objects.first()
+
+    def get(self):
+        request = self.factory.get(reverse('contact:home'))
+        request.user = AnonymousUser()
+        return home_page(request)
+
+    def test_home_page_cached(self):
+        """Test check that cached home page makes no queries."""
+        self.get()
+        with self.assertNumQueries(0):
+            response = self.get()
+        self.assertContains(response, self.person.name)
+        self.assertContains(response, 'Edit')
+
+    def test_home_page_invalidated(self):
+        """Test check that saving or deleting person renders card again."""
+        self.get()
+        self.person.name = 'Changed'
+        self.person.save()
+        self.assertContains(self.get(), 'Changed')
+
+        Person.objects.all().delete()
+        response = self.get()
+        self.assertNotContains(response, 'Changed')
+        self.assertContains(response,
+                            '<li class="list-group-item">Email:</li>',
+                            html=True)
+
+    def test_home_page_stampede(self):
+        """
+        Test check that while one request renders the card others serve
+        the old card or wait for it instead of rendering it too.
+        """
+        calls = []
+
+        def render():
+            calls.append(1)
+            return 'card %d' % len(calls)
+
+        # the card expired and somebody renders it again
+        with override_settings(HOME_PAGE_CACHE={'TIMEOUT': -1}):
+            self.assertEqual(home_card_cache.get(render), 'card 1')
+            key = 'hello:home_card:%s:lock' % home_card_cache.version()
+            home_card_cache.cache.add(key, True)
+            self.assertEqual(home_card_cache.get(render), 'card 1')
+            self.assertEqual(len(calls), 1)
+            home_card_cache.cache.delete(key)
+            self.assertEqual(home_card_cache.get(render), 'card 2')
+
+        # no card of a new version: wait, then render it ourselves
+        home_card_cache.changed()
+        key = 'hello:home_card:%s:lock' % home_card_cache.version()
+        home_card_cache.cache.add(key, True)
+        with override_settings(HOME_PAGE_CACHE={'LOCK_TIMEOUT': 0.1}):
+            self.assertEqual(home_card_cache.get(render), 'card 3')
+        self.assertIsNone(home_card_cache.cache.get(key.replace(':lock', '')))
+
+    def test_home_page_file_lock(self):
+        """
+        Test check that with the file-based cache the card is locked by
+        a file only one request creates, which is taken over once stale.
+        """
+        card_cache = FragmentCache('test_card')
+        with override_settings(HOME_PAGE_CACHE={'ALIAS': 'files'}):
+            self.assertTrue(card_cache._lock('key', 10))
+            self.assertFalse(card_cache._lock('key', 10))
+            card_cache._unlock('key')
+            self.assertTrue(card_cache._lock('key', 10))
+
+            # left by a request that died
+            stale = time.time() - 60
+            os.utime(card_cache._lock_file('key'), (stale, stale))
+            self.assertFalse(card_cache._lock('key', 10))
+            self.assertTrue(card_cache._lock('key', 10))
+            card_cache._unlock('key')
+            self.assertFalse(os.path.exists(card_cache._lock_file('key')))
+
 
 class RequestAjaxTest(TestCase):
+    multi_db = True
     fixtures = ['_initial_data.json']
 
     def test_request_ajax_view(self):
@@ -139,8 +265,141 @@ class RequestAjaxTest(TestCase):
                                    HTTP_X_REQUESTED_WITH='XMLHttpRequest')
         self.assertIn('ok', response.content)
 
+    def test_request_ajax_conditional_get(self):
+        """
+        Test check that request_ajax answers 304 until there is a new
+        request or the number of new requests changes.
+        """
+        self.client.get(reverse('contact:home'))
+        response = self.client.get(reverse('contact:request_ajax'),
+                                   HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        etag = response['ETag']
+
+        response = self.client.get(reverse('contact:request_ajax'),
+                                   HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # requests are viewed
+        self.client.get(reverse('contact:request'))
+        response = self.client.get(reverse('contact:request_ajax'),
+                                   HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # new request
+        self.client.get(reverse('contact:home'))
+        response = self.client.get(reverse('contact:request_ajax'),
+                                   HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class RequestApiTest(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        priority_registry.clear()
+        for i in range(1, 6):
+            path = '/test%s/' % i
+            RequestStore.objects.create(
+                path=path, method='GET',
+                request_path_id=priority_registry.path_id(path))
+        self.ids = list(RequestStore.objects.order_by('id')
+                                            .values_list('id', flat=True))
+
+    def test_request_api_since_id(self):
+        """
+        Test check that request_api returns only requests newer than
+        since_id as flat rows.
+        """
+        priority_registry.set('/test5/', 3)
+        response = self.client.get(reverse('contact:request_api'),
+                                   {'since_id': self.ids[2]})
+        data = json.loads(response.content)
+        self.assertEqual(data['rows'], [
+            [self.ids[3], '/test4/', 'GET', 0, data['rows'][0][4]],
+            [self.ids[4], '/test5/', 'GET', 3, data['rows'][1][4]],
+        ])
+        self.assertEqual(data['cursor'], self.ids[4])
+        self.assertEqual(data['new'], 5)
+        self.assertFalse(data['more'])
+
+        # nothing new: cursor stays the same
+        response = self.client.get(reverse('contact:request_api'),
+                                   {'since_id': data['cursor']})
+        data = json.loads(response.content)
+        self.assertEqual(data['rows'], [])
+        self.assertEqual(data['cursor'], self.ids[4])
+
+    def test_request_api_limit(self):
+        """Test check limit of request_api rows."""
+        # without since_id: newest requests
+        response = self.client.get(reverse('contact:request_api'),
+                                   {'limit': 2})
+        data = json.loads(response.content)
+        self.assertEqual([row[0] for row in data['rows']], self.ids[3:])
+
+        response = self.client.get(reverse('contact:request_api'),
+                                   {'since_id': 0, 'limit': 2})
+        data = json.loads(response.content)
+        self.assertEqual([row[0] for row in data['rows']], self.ids[:2])
+        self.assertTrue(data['more'])
+
+        for params in ({'limit': 0}, {'limit': 1000}, {'since_id': 'x'}):
+            response = self.client.get(reverse('contact:request_api'),
+                                       params)
+            self.assertEqual(response.status_code, 400)
+
+
+class RequestPollTest(TestCase):
+    multi_db = True
+
+    def test_request_poll_new_requests(self):
+        """
+        Test check that request_poll answers at once when there are
+        requests newer than since_id and returns new cursor.
+        """
+        self.client.get(reverse('contact:home'))
+        last_id = RequestStore.objects.get().id
+
+        response = self.client.get(reverse('contact:request_poll'),
+                                   {'since_id': 0})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['new'], 1)
+        self.assertEqual(data['cursor'], last_id)
+        self.assertEqual(data['rows'][0][1:3], ['/', 'GET'])
+
+    @override_settings(REQUEST_POLL_TIMEOUT=0)
+    def test_request_poll_timeout(self):
+        """
+        Test check that request_poll returns 204 when no requests newer
+        than since_id arrived before timeout.
+        """
+        self.client.get(reverse('contact:home'))
+        last_id = RequestStore.objects.get().id
+
+        response = self.client.get(reverse('contact:request_poll'),
+                                   {'since_id': last_id})
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.content, b'')
+
+        # request_poll itself isn't recorded
+        self.assertEqual(RequestStore.objects.count(), 1)
+
+        response = self.client.get(reverse('contact:request_poll'),
+                                   {'since_id': 'x'})
+        self.assertEqual(response.status_code, 400)
+
 
 class RequestViewTest(TestCase):
+    multi_db = True
+
+    def setUp(self):
+        priority_registry.clear()
+
     def test_request_view(self):
         """
         Test check access to request_view page
@@ -214,7 +473,7 @@ class RequestViewTest(TestCase):
         # method - 'GET' and default priority - 0
         self.assertEqual(request_store.path, '/')
         self.assertEqual(request_store.method, 'GET')
-        self.assertEqual(request_store.priority, 0)
+        self.assertEqual(request_store.request_path.priority, 0)
 
         # POST to request_ajax view request with path - '/'and priority - '2'
         response = self.client.post(reverse('contact:request_ajax'),
@@ -228,7 +487,7 @@ class RequestViewTest(TestCase):
         # and priority changed to '2'
         self.assertEqual(request_store.path, '/')
         self.assertEqual(request_store.method, 'GET')
-        self.assertEqual(request_store.priority, 2)
+        self.assertEqual(request_store.request_path.priority, 2)
 
         # POST to request_ajax view request with path - '/'and priority - '-2'
         response = self.client.post(reverse('contact:request_ajax'),
@@ -240,10 +499,23 @@ class RequestViewTest(TestCase):
         # and priority didn't changed
         self.assertEqual(request_store.path, '/')
         self.assertEqual(request_store.method, 'GET')
-        self.assertEqual(request_store.priority, 2)
+        self.assertEqual(request_store.request_path.priority, 2)
+
+
+def person_data(**data):
+    """Form data of the stored person with ``data`` changed."""
+    person = Person.objects.first()
+    fields = dict(name=person.name, surname=person.surname,
+                  date_of_birth=person.date_of_birth.strftime('%Y-%m-%d'),
+                  bio=person.bio, email=person.email,
+                  jabber=person.jabber, skype_id=person.skype_id,
+                  other=person.other)
+    fields.update(data)
+    return fields
 
 
 class FormPageTest(TestCase):
+    multi_db = True
     fixtures = ['_initial_data.json']
 
     def setUp(self):
@@ -312,6 +584,7 @@ class FormPageTest(TestCase):
         edit_person = Person.objects.first()
         self.assertEqual('Ivan', edit_person.name)
 
+    @override_settings(IMAGE_PIPELINE_WORKERS=0)
     def test_form_page_upload_image(self):
         """Test check upload image file in form page."""
 
@@ -334,8 +607,78 @@ class FormPageTest(TestCase):
         # delete test.jpg file
         person.delete()
 
+    def test_form_page_unchanged(self):
+        """
+        Test check that person isn't written when form is posted
+        without changes, and only changed fields are written otherwise.
+        """
+        self.client.login(username='admin', password='admin')
+        modified = Person.objects.first().modified
+
+        response = self.client.post(reverse('contact:form'),
+                                    person_data(),
+                                    HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Person.objects.first().modified, modified)
+
+        response = self.client.post(reverse('contact:form'),
+                                    person_data(name='Ivan'),
+                                    HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        person = Person.objects.first()
+        self.assertEqual(person.name, 'Ivan')
+        self.assertNotEqual(person.modified, modified)
+
+
+class FormPageImageTest(TransactionTestCase):
+    # files of replaced photos are deleted once transactions commit
+    multi_db = True
+    fixtures = ['_initial_data.json']
+
+    def tearDown(self):
+        # records of committed changes, not flushed by this test
+        audit_sink.buffer.clear()
+
+    @override_settings(IMAGE_PIPELINE_WORKERS=0)
+    def test_form_page_replace_image(self):
+        """
+        Test check that files of a replaced or cleared photo are deleted.
+        """
+        self.client.login(username='admin', password='admin')
+        self.client.post(reverse('contact:form'),
+                         person_data(image=get_temporary_image()),
+                         HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        person = Person.objects.first()
+        storage = person.image.storage
+        old_files = [person.image.name] + \
+            [t['name'] for t in person.thumbnail_set()]
+
+        output = StringIO.StringIO()
+        Img.new('RGB', (300, 300), (0, 0, 255)).save(output, format='JPEG')
+        output.seek(0)
+        output.name = 'blue.jpg'
+        self.client.post(reverse('contact:form'),
+                         person_data(image=output),
+                         HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        person = Person.objects.first()
+        self.assertTrue(person.image.name.endswith('blue.jpg'))
+        self.assertTrue(person.image_ready)
+        for name in old_files:
+            self.assertFalse(storage.exists(name))
+
+        new_files = [person.image.name] + \
+            [t['name'] for t in person.thumbnail_set()]
+        self.client.post(reverse('contact:form'),
+                         person_data(**{'image-clear': 'on'}),
+                         HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        person = Person.objects.first()
+        self.assertFalse(person.image)
+        self.assertEqual(person.image_hash, '')
+        for name in new_files:
+            self.assertFalse(storage.exists(name))
+
 
 class EditLinkTagTest(TestCase):
+    multi_db = True
     fixtures = ['_initial_data.json']
     TEMPLATE_TAG = Template('{% load edit_link %} {% edit_link person %}')
     TEMPLATE_FOR_TAG = Template('<a href="{{ edit_link }}">admin</a>')
@@ -352,3 +695,62 @@ class EditLinkTagTest(TestCase):
         context_edit_link = Context(edit_link(self.person))
         self.assertEqual(self.TEMPLATE_TAG.render(context_person).strip(),
                          self.TEMPLATE_FOR_TAG.render(context_edit_link))
+
+    def test_edit_link_urls(self):
+        """
+        Test check that edit_link gives admin change url of registered
+        models without queries and nothing for other models.
+        """
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(0):
+            context_person = Context({'person': self.person})
+            self.TEMPLATE_TAG.render(context_person)
+            url = admin_change_url(self.person)
+            path_url = admin_change_url(RequestPath(pk=5))
+            user_url = admin_change_url(User(pk=1))
+            content_type_url = admin_change_url(ContentType(pk=1))
+        self.assertEqual(url, reverse('admin:hello_person_change',
+                                      args=(self.person.pk,)))
+        self.assertEqual(path_url, '/admin/hello/requestpath/5/')
+        self.assertEqual(user_url, '/admin/auth/user/1/')
+        self.assertIsNone(content_type_url)
+        self.assertIsNone(admin_change_url(Person()))
+
+
+@override_settings(IMAGE_PIPELINE_WORKERS=0)
+class ResponsiveImageTagTest(TestCase):
+    multi_db = True
+    fixtures = ['_initial_data.json']
+    TEMPLATE_TAG = Template('{% load thumbnails %}'
+                            '{% responsive_image person "50vw" "photo" %}')
+
+    def setUp(self):
+        self.person = Person.objects.first()
+
+    def test_responsive_image_tag(self):
+        """
+        Test check that responsive_image renders srcset of thumbnails
+        with their widths and size of the default thumbnail.
+        """
+        self.assertEqual(
+            self.TEMPLATE_TAG.render(Context({'person': self.person}))
+                .strip(), '')
+
+        self.person.image = get_temporary_image()
+        self.person.save()
+        person = Person.objects.first()
+        html = self.TEMPLATE_TAG.render(Context({'person': person}))
+
+        url = person.thumbnail.storage.url
+        image_hash = person.image_hash
+        default = url('photo/thumbnail/%s-200.jpg' % image_hash)
+        self.assertIn('src="%s"' % default, html)
+        self.assertIn('srcset="%s 400w, %s 200w, %s 100w"' % (
+            url('photo/thumbnail/%s-400.jpg' % image_hash),
+            url('photo/thumbnail/%s-200.jpg' % image_hash),
+            url('photo/thumbnail/%s-100.jpg' % image_hash)), html)
+        self.assertIn('sizes="50vw" width="200" height="116"', html)
+        for thumbnail in person.thumbnail_set():
+            self.assertIn(thumbnail['type'], ('image/jpeg', 'image/webp'))
+
+        person.delete()
@@ -9,6 +9,9 @@ urlpatterns = patterns(
     url(r'^$', 'hello.views.home_page', name='home'),
     url(r'^requests/$', 'hello.views.request_view', name='request'),
     url(r'^request_ajax/$', 'hello.views.request_ajax', name='request_ajax'),
+    url(r'^request_poll/$', 'hello.views.request_poll', name='request_poll'),
+    url(r'^api/v1/requests/$', 'hello.views.request_api',
+        name='request_api'),
     url(r'^add_contact/$', 'hello.views.form_page', name='form'),
     url(r'^add_contact/success/$',
         TemplateView.as_view(template_name="success.html"), name='success'),
@@ -1,90 +1,175 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
 from django.core import serializers
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponse
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.views.decorators.http import condition
 
 import time
 import json
 
-from .models import Person, RequestStore
+from .models import Person, RequestStore, RequestWatermark
 from .decorators import not_record_request
+from .registry import priority_registry
+from .feed import request_feed
 from .forms import PersonForm
+from .pagecache import home_card_cache
 
 
+REQUEST_API_LIMIT = 10
+REQUEST_API_MAX_LIMIT = 100
+
+
+def _home_page_etag(request):
+    # the version changes with every save of a person, see signals; it
+    # outlives deploys, which change templates and names of static files
+    return '%s-%s-%s' % (staticfiles_storage.build_id(),
+                         home_card_cache.version(), request.user.pk or '')
+
+
+def _home_card():
+    person = Person.objects.primary()
+    return person, render_to_string('home_card.html', {'person': person})
+
+
+@condition(etag_func=_home_page_etag)
 def home_page(request):
-    context = {}
-    person = Person.objects.first()
-    context['person'] = person
+    person, card = home_card_cache.get(_home_card)
+    context = {'person': person, 'card': card}
     return render(request, 'home.html', context)
 
 
 @not_record_request
 def request_view(request):
-    RequestStore.objects.filter(new_request=1).update(new_request=0)
+    RequestWatermark.objects.mark_seen(RequestStore.objects.last_id())
     if request.is_ajax():
         return HttpResponse('ok')
 
     return render(request, 'request.html')
 
 
+def _request_ajax_etag(request):
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    last_id = request_feed.last_id()
+    return '%d-%d' % (last_id, RequestWatermark.objects.last_seen())
+
+
 @not_record_request
+@condition(etag_func=_request_ajax_etag)
 def request_ajax(request):
     if request.is_ajax():
         if request.method == 'POST':
             path = request.POST['path']
             priority = request.POST['priority']
             if int(priority) >= 0:
-                RequestStore.objects.filter(path=path)\
-                                    .update(priority=priority)
+                priority_registry.set(path, int(priority))
             return HttpResponse(json.dumps({'response': 'ok'}),
                                 content_type='application/json')
 
-        new_request = RequestStore.objects.filter(new_request=1).count()
-        request_list = RequestStore.objects.all()[:10]
-        list_req = serializers.serialize("json", request_list)
-        data = json.dumps((new_request, list_req))
+        data = json.dumps(_request_list())
         return HttpResponse(data, content_type="application/json")
 
     return None
 
 
+@not_record_request
+def request_api(request):
+    """
+    Requests newer than ``since_id`` (the newest ``limit`` requests
+    without it) in id order as ``[id, path, method, priority, date]``
+    rows, along with the new cursor and number of new requests.
+    """
+    try:
+        since_id, limit = _request_api_params(request)
+    except ValueError as e:
+        return HttpResponseBadRequest(unicode(e))
+
+    return _request_rows_response(since_id, limit)
+
+
+@not_record_request
+def request_poll(request):
+    """
+    Long-poll version of request_api: answers when there are requests
+    newer than ``since_id`` or with 204 after REQUEST_POLL_TIMEOUT seconds.
+    """
+    try:
+        since_id, limit = _request_api_params(request)
+    except ValueError as e:
+        return HttpResponseBadRequest(unicode(e))
+
+    timeout = getattr(settings, 'REQUEST_POLL_TIMEOUT', 25)
+    if request_feed.wait(since_id or 0, timeout) is None:
+        return HttpResponse(status=204)
+
+    return _request_rows_response(since_id, limit)
+
+
+def _request_api_params(request):
+    since_id = request.GET.get('since_id')
+    limit = request.GET.get('limit', REQUEST_API_LIMIT)
+    try:
+        since_id = int(since_id) if since_id is not None else None
+        limit = int(limit)
+    except ValueError:
+        raise ValueError('since_id and limit must be integers')
+    if not 0 < limit <= REQUEST_API_MAX_LIMIT:
+        raise ValueError('limit must be from 1 to %d' % REQUEST_API_MAX_LIMIT)
+    return since_id, limit
+
+
+def _request_rows_response(since_id, limit):
+    requests = RequestStore.objects.values_list('id', 'path', 'method',
+                                                'request_path__priority',
+                                                'date')
+    if since_id is None:
+        requests = reversed(requests.order_by('-id')[:limit])
+        more = False
+    else:
+        requests = list(requests.filter(id__gt=since_id)
+                                .order_by('id')[:limit + 1])
+        more = len(requests) > limit
+        requests = requests[:limit]
+
+    rows = [[pk, path, method, priority or 0, date.isoformat()]
+            for pk, path, method, priority, date in requests]
+    data = {
+        'cursor': rows[-1][0] if rows else since_id or 0,
+        'more': more,
+        'new': RequestWatermark.objects.unseen(),
+        'rows': rows,
+    }
+    return HttpResponse(json.dumps(data, separators=(',', ':')),
+                        content_type='application/json')
+
+
+def _request_list():
+    new_request = RequestWatermark.objects.unseen()
+    request_list = RequestStore.objects.all()[:10]
+    list_req = serializers.serialize("json", request_list)
+    return (new_request, list_req)
+
+
 @login_required
 @not_record_request
 def form_page(request):
-    person = Person.objects.first()
+    person = Person.objects.primary()
 
     if request.method == 'POST':
-        form = PersonForm(request.POST, request.FILES)
+        form = PersonForm(request.POST, request.FILES, instance=person)
 
         if form.is_valid():
-            name = form.cleaned_data.get('name')
-            surname = form.cleaned_data.get('surname')
-            date_of_birth = form.cleaned_data.get('date_of_birth')
-            bio = form.cleaned_data.get('bio')
-            email = form.cleaned_data.get('email')
-            jabber = form.cleaned_data.get('jabber')
-            skype_id = form.cleaned_data.get('skype_id')
-            other = form.cleaned_data.get('other')
-            image = form.cleaned_data.get('image')
-
-            if request.POST.get('image-clear') is None:
-                if image is None:
-                    image = person.image
-
-            person = Person(id=person.id,
-                            name=name,
-                            surname=surname,
-                            date_of_birth=date_of_birth,
-                            bio=bio,
-                            email=email,
-                            jabber=jabber,
-                            skype_id=skype_id,
-                            other=other,
-                            image=image)
+            # edit the stored person in place: only changed fields are
+            # written, and its photo is kept unless a new one is uploaded
+            person = form.save(commit=False)
+            if request.POST.get('image-clear') is not None:
+                person.image = None
             person.save()
 
             if request.is_ajax():
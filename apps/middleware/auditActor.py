@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from apps.hello.audit import set_actor
+
+
+class AuditActorMiddleware(object):
+    """Record the request user as actor of model changes it makes."""
+
+    def process_request(self, request):
+        set_actor(request)
+
+    def process_response(self, request, response):
+        set_actor(None)
+        return response
+
+    def process_exception(self, request, exception):
+        set_actor(None)
@@ -1,15 +1,23 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+from django.conf import settings
+from django.db import router, transaction
+from django.utils import timezone
 
 import logging
 
 from apps.hello.models import RequestStore
+from apps.hello.buffers import request_buffer
+from apps.hello.feed import request_feed
+from apps.hello.registry import priority_registry
 
 
 logger = logging.getLogger(__name__)
 
 
 class RequestMiddle(object):
+    buffer = request_buffer
+
     def process_view(self, request, view_func, *view_args, **view_kwargs):
         log_msg = '%s %s' % (request.method, request.path)
 
@@ -17,17 +25,25 @@ class RequestMiddle(object):
             req = RequestStore()
             req.path = request.path
             req.method = request.method
-
-            existent_reg = RequestStore.objects\
-                                       .filter(path=request.path).first()
-            if existent_reg is not None:
-                req.priority = existent_reg.priority
+            req.date = timezone.now()
+            req.request_path_id = priority_registry.path_id(request.path)
 
             if request.user.is_authenticated():
-                req.user = request.user
-
-            req.save()
-            logger.info(log_msg + ' was saved')
+                req.user_id = request.user.pk
+
+            if getattr(settings, 'REQUEST_LOG_BUFFERED', False):
+                if self.buffer.put(req):
+                    logger.info(log_msg + ' was queued')
+                else:
+                    logger.warning(log_msg + ' was dropped')
+            else:
+                # one write transaction of the log database per request
+                using = router.db_for_write(RequestStore)
+                with transaction.atomic(using=using):
+                    req.save(using=using)
+                    RequestStore.objects.count_hits([req])
+                request_feed.notify()
+                logger.info(log_msg + ' was saved')
         else:
             logger.info(log_msg + ' wasn\'t saved')
 
@@ -0,0 +1 @@
+!function(factory){"use strict";"function"==typeof define&&define.amd?define(["jquery"],factory):factory(jQuery)}(function($){"use strict";return $.ui=$.ui||{},$.ui.version="1.13.2"});
\ No newline at end of file
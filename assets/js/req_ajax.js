@@ -1,36 +1,118 @@
 var helloRequest = (function($){
 
-  function handleRequest(data) {
+  // rows are [id, path, method, priority, date], newest first
+  var rows = [];
+  var cursor = null;
+  var newRequests = 0;
+  var MAX_ROWS = 10;
+  // failed long-polls in a row, retried with growing delays
+  var pollFailures = 0;
+  var MAX_POLL_FAILURES = 5;
+  var MAX_POLL_DELAY = 30000;
+
+  function render() {
     var items = ['<thead><tr><th>Path</th>\
-                 <th>Method</th><tr></thead>'];
-                 
-    var j_data = $.parseJSON(data[1]);
-    var id = data[0];
-    $.each(j_data, function(i, val) {
-        items.push('<tr>'
-                    + '<td>' + val.fields.path + '</td>'
-                    + '<td>' + val.fields.method + '</td>'
-                    + '</tr>'
-        );
+                 <th>Method</th><th>Priority</th>\
+                 <th>Up</th><th>Down</th><tr></thead>'];
+
+    // paths and methods are sent by any client, set them as text only
+    $.each(rows, function(i, row) {
+        items.push($('<tr>').append(
+            $('<td class="path">').text(row[1]),
+            $('<td>').text(row[2]),
+            $('<td class="priority">').text(row[3]),
+            '<td><span>Up</span></td>',
+            '<td><span>Down</span></td>'
+        ));
    });
    var title = $('title').text().split(')')[1] || $('title').text();
-   var pre_titile = id ? '(' + id + ') ' : '';
-   $('#request').html(items);
+   var pre_titile = newRequests ? '(' + newRequests + ') ' : '';
+   $('#request').empty().append(items);
    $('title').text(pre_titile + title);
-   var str_elem = parseInt(id, 10) + 2;
+   var str_elem = parseInt(newRequests, 10) + 2;
    $('tr:lt('+str_elem+')').not('tr th').addClass('req');
  }
 
- return {
-     loadRequest: function(){
-         $.ajax({
-             url: '/request_ajax/',
-             dataType : "json",
-             success: function(data, textStatus) {
+ function handleRequest(data) {
+    var i;
+    for (i = 0; i < data.rows.length; i++) {
+        rows.unshift(data.rows[i]);
+    }
+    rows = rows.slice(0, MAX_ROWS);
+    cursor = data.cursor;
+    newRequests = data['new'];
+    render();
+ }
+
+ function params() {
+    return cursor === null ? {} : {'since_id': cursor};
+ }
+
+ function loadRequest() {
+     $.ajax({
+         url: '/api/v1/requests/',
+         data: params(),
+         dataType : "json",
+         success: function(data, textStatus) {
+             handleRequest(data);
+         }
+     });
+ }
+
+ // fall back to polling the api if long-poll doesn't work
+ function fallback() {
+     loadRequest();
+     setInterval(loadRequest, 500);
+ }
+
+ // a restarted or timed out worker fails a poll or two, retry those
+ function pollFailed() {
+     pollFailures++;
+     if (pollFailures >= MAX_POLL_FAILURES) {
+         fallback();
+         return;
+     }
+     var delay = Math.min(1000 * Math.pow(2, pollFailures - 1),
+                          MAX_POLL_DELAY);
+     setTimeout(pollRequest, delay);
+ }
+
+ function pollRequest() {
+     $.ajax({
+         url: '/request_poll/',
+         data: params(),
+         dataType : "json",
+         success: function(data, textStatus, jqXHR) {
+             // 204: no new requests before server timeout
+             if (jqXHR.status == 200) {
                  handleRequest(data);
              }
-         });
-     }
+             pollFailures = 0;
+             pollRequest();
+         },
+         error: pollFailed
+     });
+ }
+
+ function setPriority(path, priority) {
+     $.each(rows, function(i, row) {
+         if (row[1] == path) {
+             row[3] = priority;
+         }
+     });
+     render();
+ }
+
+ function viewed() {
+     newRequests = 0;
+     render();
+ }
+
+ return {
+     loadRequest: loadRequest,
+     pollRequest: pollRequest,
+     setPriority: setPriority,
+     viewed: viewed
  };
 })(jQuery);
 
@@ -40,11 +122,11 @@ $(window).on('focus', function() {
         method: 'GET',
         success: function() {
              console.log('requests is viewed');
+             helloRequest.viewed();
         }
     });
 });
 
 $(document).ready(function(){
-    helloRequest.loadRequest();
-    setInterval(helloRequest.loadRequest, 500);
-});
\ No newline at end of file
+    helloRequest.pollRequest();
+});
@@ -41,6 +41,7 @@ $(document).ready(function(){
             beforeSend: beforeSendHandler,
             success: function(data) {
                 console.log(data.response);
+                helloRequest.setPriority(path, priority);
             },
             error: function (jqXHR, textStatus, errorThrown){
                 console.log(jqXHR);
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+WSGI wrapper serving collected static files and uploads in front of
+Django, for deployments without a separate web server.
+"""
+from __future__ import unicode_literals
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from wsgiref.util import FileWrapper
+import mimetypes
+import os
+import posixpath
+import re
+import urllib
+
+
+BLOCK_SIZE = 64 * 1024
+
+# names given by collectstatic, and content-addressed thumbnails of
+# photos (<sha1>-<size>.<ext>, see apps.hello.images.thumbnail_name),
+# their contents never change
+HASHED_NAME = re.compile(r'(\.[0-9a-f]{12}|/[0-9a-f]{40}-\d+)\.\w+$')
+YEAR = 365 * 24 * 60 * 60
+
+
+class FileServer(object):
+    """
+    Serves GET and HEAD requests for files under the url ``prefix`` ->
+    directory pairs of ``locations``, passes everything else to
+    ``application``.
+
+    Bodies are handed to the server's ``wsgi.file_wrapper``, which
+    sends them with sendfile() where it can (gunicorn does). A ``.gz``
+    copy next to a file is sent to clients accepting gzip. Files named
+    with a content hash are cached by browsers for a year, others are
+    revalidated after ``max_age`` seconds.
+    """
+
+    def __init__(self, application, locations, max_age=60):
+        self.application = application
+        self.locations = [(prefix, os.path.abspath(root))
+                          for prefix, root in locations]
+        self.max_age = max_age
+
+    def __call__(self, environ, start_response):
+        if environ['REQUEST_METHOD'] in ('GET', 'HEAD'):
+            path = self.find(environ.get('PATH_INFO', ''))
+            if path is not None:
+                return self.serve(path, environ, start_response)
+        return self.application(environ, start_response)
+
+    def find(self, url_path):
+        for prefix, root in self.locations:
+            if not url_path.startswith(prefix):
+                continue
+            name = posixpath.normpath(urllib.unquote(url_path[len(prefix):]))
+            if name.startswith(('..', '/')) or '\0' in name:
+                return None
+            path = os.path.join(root, *name.split('/'))
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def serve(self, path, environ, start_response):
+        content_type, encoding = mimetypes.guess_type(path)
+        if HASHED_NAME.search(path):
+            cache_control = 'public, max-age=%d, immutable' % YEAR
+        else:
+            cache_control = 'public, max-age=%d' % self.max_age
+        headers = [('Content-Type', content_type or
+                    'application/octet-stream'),
+                   ('Cache-Control', cache_control),
+                   ('Vary', 'Accept-Encoding')]
+        if encoding is None and \
+                'gzip' in environ.get('HTTP_ACCEPT_ENCODING', '') and \
+                os.path.isfile(path + '.gz'):
+            headers.append(('Content-Encoding', 'gzip'))
+            path += '.gz'
+
+        stat = os.stat(path)
+        headers.append(('Last-Modified', http_date(stat.st_mtime)))
+
+        if not was_modified_since(environ.get('HTTP_IF_MODIFIED_SINCE'),
+                                  stat.st_mtime, stat.st_size):
+            start_response(b'304 Not Modified', self._native(headers))
+            return []
+
+        headers.append(('Content-Length', str(stat.st_size)))
+        start_response(b'200 OK', self._native(headers))
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            return []
+        file_wrapper = environ.get('wsgi.file_wrapper', FileWrapper)
+        return file_wrapper(open(path, 'rb'), BLOCK_SIZE)
+
+    def _native(self, headers):
+        # WSGI on python 2 wants byte strings
+        return [(str(name), str(value)) for name, value in headers]
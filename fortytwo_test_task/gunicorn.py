@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn config of the production serving profile:
+
+    gunicorn -c fortytwo_test_task/gunicorn.py fortytwo_test_task.wsgi
+
+Every worker process runs a pool of threads, so a long-poll request
+(/request_poll/ holds one for up to REQUEST_POLL_TIMEOUT seconds) ties
+up a thread rather than a whole worker.
+"""
+import multiprocessing
+import os
+
+
+bind = os.environ.get('BIND', '127.0.0.1:8000')
+
+workers = int(os.environ.get('WEB_CONCURRENCY',
+                             multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('THREADS', 8))
+
+# longer than the long-poll timeout
+timeout = 60
+keepalive = 5
+
+# recycle workers now and then, not all at once
+max_requests = 1000
+max_requests_jitter = 100
+
+# files of wsgi.file_wrapper are sent with sendfile()
+sendfile = True
+
+accesslog = '-'
+
+raw_env = ['DJANGO_SETTINGS_MODULE=fortytwo_test_task.settings.production']
@@ -51,6 +51,7 @@ MIDDLEWARE_CLASSES = (
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.middleware.auditActor.AuditActorMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'apps.middleware.helloRequest.RequestMiddle',
@@ -65,13 +66,47 @@ WSGI_APPLICATION = 'fortytwo_test_task.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/1.6/ref/settings/#databases
 
+# apps.backends.sqlite3 is django's sqlite3 backend with on_commit() hooks
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'apps.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
-    }
+        # run on every connection, on top of
+        # apps.backends.sqlite3.base.DEFAULT_PRAGMAS
+        'PRAGMAS': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': 5000,
+        },
+        # how atomic blocks BEGIN: DEFERRED, IMMEDIATE or EXCLUSIVE
+        'TRANSACTION_MODE': 'IMMEDIATE',
+    },
+    # request and audit logs, see apps.hello.routers.LogRouter
+    'logs': {
+        'ENGINE': 'apps.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'logs.sqlite3'),
+        'PRAGMAS': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': 5000,
+            # checkpoint the write-ahead log less often, in bigger steps
+            'wal_autocheckpoint': 10000,
+            'temp_store': 'MEMORY',
+        },
+        'TRANSACTION_MODE': 'IMMEDIATE',
+    },
+}
+
+SOUTH_DATABASE_ADAPTERS = {
+    'default': 'south.db.sqlite3',
+    'logs': 'south.db.sqlite3',
 }
 
+DATABASE_ROUTERS = ['apps.hello.routers.LogRouter']
+
+# alias of the database request and audit logs are kept in
+LOG_DATABASE = 'logs'
+
 # Internationalization
 # https://docs.djangoproject.com/en/1.6/topics/i18n/
 
@@ -118,6 +153,32 @@ STATICFILES_DIRS = (
     os.path.join(BASE_DIR, 'assets'),
 )
 
+# collectstatic copies files under names with a hash of their contents,
+# builds STATIC_BUNDLES and gzipped copies, templates link the hashed
+# names, which can be cached by browsers for good
+STATICFILES_STORAGE = 'apps.hello.staticfiles.BundledStaticFilesStorage'
+
+# Files concatenated and minified into one, in this order, by
+# collectstatic; {% bundle %} links them. A form given by its path
+# is bundled with the Media files of its widgets.
+STATIC_BUNDLES = {
+    'css/base.css': (
+        'bootstrap-3.3.5-dist/css/bootstrap.min.css',
+        'css/screen_hello.css',
+    ),
+    'js/base.js': (
+        'jquery/jquery-1.11.3.min.js',
+        'jquery/jquery.cookie.js',
+        'bootstrap-3.3.5-dist/js/bootstrap.min.js',
+    ),
+    'js/request.js': (
+        'js/req_ajax.js',
+        'js/req_ajax_priority.js',
+    ),
+    'css/form.css': 'apps.hello.forms.PersonForm',
+    'js/form.js': 'apps.hello.forms.PersonForm',
+}
+
 
 # Template Settings
 TEMPLATE_DIRS = (
@@ -128,9 +189,86 @@ TEMPLATE_DIRS = (
     os.path.join(BASE_DIR, 'templates'),
 )
 
+# Request logging
+# With REQUEST_LOG_BUFFERED RequestMiddle queues RequestStore records
+# in memory and a background thread writes them with bulk_create.
+REQUEST_LOG_BUFFERED = False
+
+REQUEST_LOG_BUFFER = {
+    'MAX_SIZE': 10000,      # records kept before new ones are dropped
+    'BATCH_SIZE': 100,      # records per bulk_create
+    'FLUSH_INTERVAL': 1.0,  # seconds between background flushes
+}
+
+# Seconds a worker trusts a path of its in-memory path -> priority
+# index. Changes made by other workers are seen at once if they share
+# a cache backend. SIZE is the number of recently used paths it keeps.
+PRIORITY_REGISTRY_TTL = 5
+PRIORITY_REGISTRY_SIZE = 10000
+
+# Seconds /request_poll/ holds a request open waiting for new requests
+REQUEST_POLL_TIMEOUT = 25
+
+# Days of requests kept by "manage.py prune_requests"
+REQUEST_RETENTION_DAYS = 30
+
+# Threads building thumbnails of uploaded photos, 0 builds them while
+# saving the person
+IMAGE_PIPELINE_WORKERS = 2
+
+# Bytes of decoded pixels a photo may take while thumbnails are built;
+# bigger uploads are rejected by the form
+IMAGE_MAX_DECODE_SIZE = 64 * 1024 * 1024
+
+# Uploads bigger than that are spooled to a temporary file on disk
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024
+
+# Model changes recorded as NoteModel; the high-volume request log models
+# are excluded, SAMPLE maps model name to share of changes recorded
+AUDIT_LOG = {
+    'EXCLUDE': ['RequestStore', 'RequestCounter'],
+    'SAMPLE': {},
+}
+
+# Committed NoteModel records are queued in memory and written with
+# bulk_create by a background thread
+AUDIT_LOG_BUFFER = {
+    'MAX_SIZE': 10000,
+    'BATCH_SIZE': 100,
+    'FLUSH_INTERVAL': 1.0,
+}
+
+# Seconds a worker serves the home page person from memory. Saves made by
+# other workers are seen at once if they share a cache backend.
+PERSON_CACHE_TTL = 60
+
+# In-process cache of this worker; 'files' is shared by the workers
+# of one host
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'files': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache'),
+    },
+}
+
+# Rendered person card of the home page. ALIAS is the cache it is kept
+# in, a card is rendered again after TIMEOUT seconds and requests wait
+# up to LOCK_TIMEOUT seconds for the one rendering it
+HOME_PAGE_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 600,
+    'LOCK_TIMEOUT': 10,
+}
+
 # Turn off south during test
 SOUTH_TESTS_MIGRATE = False
 
+# Runs tests without background flushes of buffered records
+TEST_RUNNER = 'apps.hello.runner.TestRunner'
+
 TEMPLATE_CONTEXT_PROCESSORS = (
     "django.contrib.auth.context_processors.auth",
     "django.core.context_processors.debug",
@@ -162,5 +300,13 @@ LOGGING = {
             'handlers': ['console'],
             'level': os.getenv('DJANGO_LOG_LEVEL', 'INFO'),
         },
+        'apps.hello.buffers': {
+            'handlers': ['console'],
+            'level': os.getenv('DJANGO_LOG_LEVEL', 'INFO'),
+        },
+        'apps.hello.images': {
+            'handlers': ['console'],
+            'level': os.getenv('DJANGO_LOG_LEVEL', 'INFO'),
+        },
     },
 }
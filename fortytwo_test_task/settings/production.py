@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+"""
+Settings of the gunicorn serving profile, see fortytwo_test_task/gunicorn.py.
+`make serve` collects static files with these settings and starts it.
+"""
+from .common import *
+
+DEBUG = False
+TEMPLATE_DEBUG = False
+
+ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS',
+                               'localhost,127.0.0.1').split(',')
+
+SECRET_KEY = os.environ.get('SECRET_KEY', SECRET_KEY)
+
+# templates are compiled once per worker
+TEMPLATE_LOADERS = (
+    ('django.template.loaders.cached.Loader', (
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    )),
+)
+
+# keep a db connection per worker thread between requests
+for database in DATABASES.values():
+    database['CONN_MAX_AGE'] = 60
+
+# workers render the home page card once for all of them
+HOME_PAGE_CACHE = dict(HOME_PAGE_CACHE, ALIAS='files')
+
+# requests are written in batches instead of one INSERT per request
+REQUEST_LOG_BUFFERED = True
+
+# wsgi.py serves STATIC_ROOT and MEDIA_ROOT itself, with sendfile()
+WSGI_SERVE_FILES = True
@@ -10,5 +10,15 @@ https://docs.djangoproject.com/en/1.6/howto/deployment/wsgi/
 import os
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "fortytwo_test_task.settings")
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 application = get_wsgi_application()
+
+# static files and uploads without a web server in front, see
+# settings.production
+if getattr(settings, 'WSGI_SERVE_FILES', False):
+    from fortytwo_test_task.fileserver import FileServer
+    application = FileServer(application, (
+        (settings.STATIC_URL, settings.STATIC_ROOT),
+        (settings.MEDIA_URL, settings.MEDIA_ROOT),
+    ))